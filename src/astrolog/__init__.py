@@ -1,10 +1,12 @@
 from .primitives import GeoLocation, Angle, AngularSpeed
+from .topo import Observer
 from .coords import HorCoord, EclCoord, EquatorCoord, EclSpeed, EquatorSpeed
 from .zodiac import Zodiac, ZodiacConstell
+from .snapshot import SkySnapshot
 from .natal import NatalObject, Natal
 from .celestials import Celestial, Planet, ApsisNode, ApoApsis, PeriApsis, AscNode, DscNode, SecondFocus, FixedCelestial
 
-__all__ = [GeoLocation, Angle, AngularSpeed, HorCoord, EclCoord, EquatorCoord, EclSpeed, EquatorSpeed,
+__all__ = [GeoLocation, Angle, AngularSpeed, Observer, HorCoord, EclCoord, EquatorCoord, EclSpeed, EquatorSpeed,
            Zodiac, ZodiacConstell,
-           Natal, NatalObject,
+           Natal, NatalObject, SkySnapshot,
            Celestial, Planet, SecondFocus, ApsisNode, ApoApsis, PeriApsis, AscNode, DscNode, FixedCelestial]
\ No newline at end of file
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import functools
+import weakref
+
+import numpy as np
+
+from .celestials import Celestial
+from .coords import EclCoord, EquatorCoord, HorCoord, EclSpeed, EquatorSpeed
+from .natal import Natal
+from .pool import EphemerisPool
+from .primitives import GeoLocation
+
+
+class AsyncEphemeris:
+    """asyncio facade for chart and ephemeris computation.
+
+    swisseph keeps its state (observer, file and position caches) per thread, so without a `pool` all work
+    runs on one dedicated thread, where that state stays warm; the observer is tracked per thread by `topo`,
+    so calls on this thread and on the caller's threads do not disturb each other. With an `EphemerisPool`
+    charts and series go to its worker processes. At most `concurrency` computations of one event loop are
+    in flight at a time, further awaits wait for a free slot without blocking the event loop.
+    """
+
+    def __init__(self, *, concurrency: int = 32, pool: EphemerisPool | None = None):
+        self.pool = pool
+        self.concurrency = concurrency
+        # an `asyncio.Semaphore` binds to the loop it is first contended in, so each loop gets its own
+        self.__semaphores = weakref.WeakKeyDictionary()
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="astrolog")
+
+    def shutdown(self, wait: bool = True):
+        self.__executor.shutdown(wait=wait)
+
+    def __semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self.__semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self.__semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        return semaphore
+
+    async def __run(self, func, *args, **kwargs):
+        async with self.__semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.__executor, functools.partial(func, *args, **kwargs))
+
+    async def __wait(self, future):
+        async with self.__semaphore():
+            return await asyncio.wrap_future(future)
+
+    async def natal(self, person: str, birth: datetime, place: GeoLocation, celestials: [Celestial]) -> Natal:
+        if self.pool is not None:
+            return await self.__wait(self.pool.submit_natal(person, birth, place, celestials))
+        return await self.__run(Natal, person, birth, place, celestials)
+
+    async def aspects(self, natal: Natal, orb: float = 1.01, of=None, to=None) -> list:
+        return await self.__run(lambda: list(natal.aspects(orb=orb, of=of, to=to)))
+
+    async def parans(self, natal: Natal, orb: timedelta = timedelta(minutes=5)) -> list:
+        return await self.__run(natal.parans, orb=orb)
+
+    async def transits(self, celestial: Celestial, time: datetime, location: GeoLocation) -> dict:
+        return await self.__run(celestial.transits, time, location)
+
+    async def ecl_coord(self, celestial: Celestial, time: datetime, location: GeoLocation, *,
+                        speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
+        return await self.__run(celestial.ecl_coord, time, location, speed=speed, mean=mean)
+
+    async def equator_coord(self, celestial: Celestial, time: datetime, location: GeoLocation, *,
+                            speed: bool = False, mean: bool = False) -> EquatorCoord | EquatorSpeed:
+        return await self.__run(celestial.equator_coord, time, location, speed=speed, mean=mean)
+
+    async def hor_coord(self, celestial: Celestial, time: datetime, location: GeoLocation, *,
+                        mean: bool = False) -> HorCoord:
+        return await self.__run(celestial.hor_coord, time, location, mean=mean)
+
+    async def ecl_series(self, celestial: Celestial, jds, location: GeoLocation, *,
+                         speed: bool = False, mean: bool = False) -> np.ndarray:
+        if self.pool is not None:
+            return await self.__wait(self.pool.map_positions(celestial, jds, location, speed=speed, mean=mean))
+        return await self.__run(celestial.ecl_series, jds, location, speed=speed, mean=mean)
+
+    async def equator_series(self, celestial: Celestial, jds, location: GeoLocation, *,
+                             speed: bool = False, mean: bool = False) -> np.ndarray:
+        if self.pool is not None:
+            return await self.__wait(self.pool.map_positions(celestial, jds, location, equatorial=True,
+                                                             speed=speed, mean=mean))
+        return await self.__run(celestial.equator_series, jds, location, speed=speed, mean=mean)
+
+
+_default = None
+
+
+def default() -> AsyncEphemeris:
+    """Shared `AsyncEphemeris` used by the module-level coroutines"""
+    global _default
+    if _default is None:
+        _default = AsyncEphemeris()
+    return _default
+
+
+async def natal(person: str, birth: datetime, place: GeoLocation, celestials: [Celestial]) -> Natal:
+    return await default().natal(person, birth, place, celestials)
+
+
+async def aspects(natal: Natal, orb: float = 1.01, of=None, to=None) -> list:
+    return await default().aspects(natal, orb=orb, of=of, to=to)
+
+
+async def parans(natal: Natal, orb: timedelta = timedelta(minutes=5)) -> list:
+    return await default().parans(natal, orb=orb)
+
+
+async def transits(celestial: Celestial, time: datetime, location: GeoLocation) -> dict:
+    return await default().transits(celestial, time, location)
+
+
+async def ecl_coord(celestial: Celestial, time: datetime, location: GeoLocation, **kwargs) -> EclCoord | EclSpeed:
+    return await default().ecl_coord(celestial, time, location, **kwargs)
+
+
+async def equator_coord(celestial: Celestial, time: datetime, location: GeoLocation, **kwargs) -> EquatorCoord | EquatorSpeed:
+    return await default().equator_coord(celestial, time, location, **kwargs)
+
+
+async def hor_coord(celestial: Celestial, time: datetime, location: GeoLocation, **kwargs) -> HorCoord:
+    return await default().hor_coord(celestial, time, location, **kwargs)
+
+
+async def ecl_series(celestial: Celestial, jds, location: GeoLocation, **kwargs) -> np.ndarray:
+    return await default().ecl_series(celestial, jds, location, **kwargs)
+
+
+async def equator_series(celestial: Celestial, jds, location: GeoLocation, **kwargs) -> np.ndarray:
+    return await default().equator_series(celestial, jds, location, **kwargs)
@@ -2,15 +2,33 @@ from abc import ABC, abstractmethod
 from datetime import datetime, time, timedelta
 from types import NoneType
 
+import numpy as np
 import swisseph as swe
 
 from . import GeoLocation, EclCoord, EquatorCoord, HorCoord
-from .coords import EclSpeed, EquatorSpeed
+from .coords import EclSpeed, EquatorSpeed, ECL_DTYPE, EQUATOR_DTYPE, HOR_DTYPE
+from .topo import set_topo, current_topo, group_by_location, Observer
+from . import transforms
+from .roots import refine
+from .timescale import julday, juldays
+
+
+TRANSIT_KINDS = ('rise', 'set', 'mc', 'ic')
+(TRANSIT_RISE, TRANSIT_SET, TRANSIT_MC, TRANSIT_IC) = range(4)
+TRANSIT_DTYPE = np.dtype([('jd', 'f8'), ('kind', 'i1')])
+# two-hourly samples for the transit search, refined by `roots.refine`
+TRANSIT_STEPS = 12
+TWILIGHT_ALTITUDE = -18.0
 
 
 class Celestial(ABC):
     """Abstract class for celestial objects whose location can be computed"""
 
+    # optional `EphemerisFile` serving positions of the bodies it holds
+    ephemeris = None
+    # optional `PositionCache` keeping swisseph results across calls
+    cache = None
+
     NAMES = {
         "SUN": swe.SUN,
         "MOON": swe.MOON,
@@ -32,18 +50,18 @@ class Celestial(ABC):
         self.name = None
 
     def ecl_coord(self, time: datetime, location: GeoLocation, *, speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
-        swe.set_topo(location.longitude.degrees, location.latitude.degrees)
-        jd = swe.julday(time.year, time.month, time.day, time.hour + time.minute / 60.)
+        set_topo(location)
+        jd = julday(time)
         return self.swe_ecl_coord(jd, speed=speed, mean=mean)
 
     def equator_coord(self, time: datetime, location: GeoLocation, *, speed: bool = False, mean: bool = False) -> EquatorCoord | EquatorSpeed:
-        swe.set_topo(location.longitude.degrees, location.latitude.degrees)
-        jd = swe.julday(time.year, time.month, time.day, time.hour + time.minute / 60.)
+        set_topo(location)
+        jd = julday(time)
         return self.swe_equator_coord(jd, speed=speed, mean=mean)
 
     def hor_coord(self, time: datetime, location: GeoLocation, *, mean: bool = False) -> HorCoord:
-        swe.set_topo(location.longitude.degrees, location.latitude.degrees)
-        jd = swe.julday(time.year, time.month, time.day, time.hour + time.minute / 60.)
+        set_topo(location)
+        jd = julday(time)
         coord = self.swe_equator_coord(jd, mean=mean)
         geopos = (location.longitude.degrees, location.latitude.degrees, 0.0)
         pos = (coord.ra.degrees, coord.decl.degrees, 0.0)
@@ -58,13 +76,73 @@ class Celestial(ABC):
     def equator_speed(self, time: datetime, location: GeoLocation, **kwargs) -> EquatorSpeed:
         return self.equator_coord(time, location, speed=True, **kwargs)
 
+    @classmethod
+    def batch_ecl_coord(cls, requests: list, *, speed: bool = False, mean: bool = False) -> list:
+        """Ecliptic coordinates for `(celestial, time, location)` requests, setting each observer only once"""
+        return cls.__batch(requests, lambda obj, jd: obj.swe_ecl_coord(jd, speed=speed, mean=mean))
+
+    @classmethod
+    def batch_equator_coord(cls, requests: list, *, speed: bool = False, mean: bool = False) -> list:
+        """Equatorial coordinates for `(celestial, time, location)` requests, setting each observer only once"""
+        return cls.__batch(requests, lambda obj, jd: obj.swe_equator_coord(jd, speed=speed, mean=mean))
+
+    @staticmethod
+    def __batch(requests: list, compute) -> list:
+        results = [None] * len(requests)
+        jds = juldays([time for (_, time, _) in requests]).tolist()
+        for (location, group) in group_by_location(enumerate(requests), lambda item: item[1][2]):
+            with Observer(location):
+                for (i, (obj, _, _)) in group:
+                    results[i] = compute(obj, jds[i])
+        return results
+
+    def ecl_series(self, jds, location: GeoLocation, *, speed: bool = False, mean: bool = False) -> np.ndarray:
+        """Ecliptic positions for an array of Julian days (UT) as a structured array of `ECL_DTYPE`"""
+        set_topo(location)
+        jds = juldays(jds)
+        return self._swe_series(jds, speed=speed, mean=mean, equatorial=False).view(ECL_DTYPE).reshape(jds.shape)
+
+    def equator_series(self, jds, location: GeoLocation, *, speed: bool = False, mean: bool = False) -> np.ndarray:
+        """Equatorial positions for an array of Julian days (UT) as a structured array of `EQUATOR_DTYPE`"""
+        set_topo(location)
+        jds = juldays(jds)
+        return self._swe_series(jds, speed=speed, mean=mean, equatorial=True).view(EQUATOR_DTYPE).reshape(jds.shape)
+
+    def hor_series(self, jds, location: GeoLocation, *, speed: bool = False, mean: bool = False) -> np.ndarray:
+        """Horizontal positions for an array of Julian days (UT) as a structured array of `HOR_DTYPE`"""
+        jds = juldays(jds)
+        equator = self.equator_series(jds, location, speed=speed, mean=mean)
+        lst = transforms.sidereal_time(jds, location.longitude.degrees)
+        out = np.zeros(jds.shape, dtype=HOR_DTYPE)
+        if speed:
+            (out['azimuth'], out['altitude'], out['azimuth_speed'], out['altitude_speed']) = transforms.equator_to_hor(
+                equator['ra'], equator['decl'], lst, location.latitude.degrees, equator['ra_speed'], equator['decl_speed'])
+        else:
+            (out['azimuth'], out['altitude']) = transforms.equator_to_hor(
+                equator['ra'], equator['decl'], lst, location.latitude.degrees)
+        return out
+
+    def _swe_series(self, jds, *, speed: bool, mean: bool, equatorial: bool) -> np.ndarray:
+        jds = np.asarray(jds, dtype=np.float64).ravel()
+        if Celestial.ephemeris is not None and not mean and Celestial.ephemeris.covers(self, jds):
+            return Celestial.ephemeris.series(self, jds, equatorial=equatorial)
+        out = np.empty((jds.size, 6), dtype=np.float64)
+        for (i, jd) in enumerate(jds.tolist()):
+            out[i] = self._calc(jd, speed=speed, mean=mean, equatorial=equatorial)
+        return out
+
     def transits(self, time: datetime, location: GeoLocation):
-        return {
-            'rise': self.rises(time, location),
-            'set': self.sets(time, location),
-            'mc': self.mc_trans(time, location),
-            'ic': self.ic_trans(time, location),
-        }
+        """Rise, set, upper (mc) and lower (ic) culmination on the day of `time`, as offsets from 0h UT.
+
+        The first event of each kind found by `transit_events` over the day; results agree with `rises`,
+        `sets`, `mc_trans` and `ic_trans` within a second.
+        """
+        tjdut = swe.julday(time.year, time.month, time.day, 0.)
+        result = dict.fromkeys(TRANSIT_KINDS)
+        for (jultime, code) in self.transit_events(tjdut, tjdut + 1.0, location).tolist():
+            if result[TRANSIT_KINDS[code]] is None:
+                result[TRANSIT_KINDS[code]] = timedelta(seconds=int((jultime - tjdut) * 86400.0))
+        return result
 
     def rises(self, time: datetime, location: GeoLocation):
         return self.__rise_trans(time, location, swe.CALC_RISE)
@@ -78,10 +156,91 @@ class Celestial(ABC):
     def ic_trans(self, time: datetime, location: GeoLocation):
         return self.__rise_trans(time, location, swe.CALC_ITRANSIT)
 
+    def transit_events(self, start: datetime | float, end: datetime | float, location: GeoLocation, *,
+                       kinds: tuple = TRANSIT_KINDS) -> np.ndarray:
+        """Every rise, set, upper (mc) and lower (ic) culmination between `start` and `end`.
+
+        Returns a `TRANSIT_DTYPE` array sorted by time; `kind` indexes `TRANSIT_KINDS`. The body is sampled
+        every two hours over the whole range and all events are refined from these shared samples at once.
+        Culminations are found first and added to the samples, so that the altitude is monotonic between
+        neighbouring samples and a short stay above or below the horizon is not missed.
+        """
+        if self.is_focal_point():
+            return np.empty(0, dtype=TRANSIT_DTYPE)
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        set_topo(location)
+        jds = start + np.arange(max(1, int(np.ceil((end - start) * TRANSIT_STEPS))) + 1) / TRANSIT_STEPS
+        samples = self.__transit_functions(jds, location)
+        (parts, times, nodes) = ([], [jds], [samples])
+        for code in (TRANSIT_MC, TRANSIT_IC):
+            i = self.__crossings(samples[code])
+            (jultimes, values) = self.__refine_transits(code, location, jds[i], jds[i + 1], samples[:, i], samples[:, i + 1])
+            parts.append((jultimes, code))
+            times.append(jultimes)
+            nodes.append(values)
+        order = np.argsort(np.concatenate(times), kind='stable')
+        (jds, samples) = (np.concatenate(times)[order], np.concatenate(nodes, axis=1)[:, order])
+        for code in (TRANSIT_RISE, TRANSIT_SET):
+            i = self.__crossings(samples[code])
+            (jultimes, _) = self.__refine_transits(code, location, jds[i], jds[i + 1], samples[:, i], samples[:, i + 1])
+            parts.append((jultimes, code))
+        rows = []
+        for (jultimes, code) in parts:
+            if TRANSIT_KINDS[code] in kinds:
+                part = np.zeros(jultimes.size, dtype=TRANSIT_DTYPE)
+                (part['jd'], part['kind']) = (jultimes, code)
+                rows.append(part[(jultimes >= start) & (jultimes < end)])
+        out = np.concatenate(rows) if rows else np.zeros(0, dtype=TRANSIT_DTYPE)
+        return out[np.argsort(out['jd'], kind='stable')]
+
+    def __transit_functions(self, jds: np.ndarray, location: GeoLocation) -> np.ndarray:
+        """Per `TRANSIT_KINDS` a function of time that crosses zero upwards at the event, shape (4, len(jds))"""
+        equator = self._swe_series(jds, speed=False, mean=False, equatorial=True)
+        lst = transforms.sidereal_time(jds, location.longitude.degrees)
+        (_, altitude) = transforms.equator_to_hor(equator[:, 0], equator[:, 1], lst, location.latitude.degrees)
+        # swisseph applies the astronomical twilight bit to body 0, the Sun, and so to fixed stars too
+        horizon = TWILIGHT_ALTITUDE if self.is_fixed() or self.swe_id() == swe.SUN else 0.0
+        hour_angle = lst - equator[:, 0]
+        return np.stack([
+            altitude - horizon,
+            horizon - altitude,
+            (hour_angle + 180.0) % 360.0 - 180.0,
+            hour_angle % 360.0 - 180.0,
+        ])
+
+    @staticmethod
+    def __crossings(values: np.ndarray) -> np.ndarray:
+        """Indices of the samples followed by an upward zero crossing, skipping the ±180° wrap of hour angles"""
+        return np.flatnonzero((values[:-1] < 0) & (values[1:] >= 0) & (values[1:] - values[:-1] < 180.0))
+
+    def __refine_transits(self, code: int, location: GeoLocation, a: np.ndarray, b: np.ndarray,
+                          values_a: np.ndarray, values_b: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Zeros of the transit function `code` bracketed by `a`, `b`, and all four transit functions there"""
+        values = np.where(values_a[code] == 0.0, values_a, values_b)
+
+        def func(jds: np.ndarray, brackets: np.ndarray) -> np.ndarray:
+            values[:, brackets] = self.__transit_functions(jds, location)
+            return values[code, brackets]
+        return refine(func, a, b, values_a[code], values_b[code]), values
+
     def __rise_trans(self, when: datetime, location: GeoLocation, rsmi: int):
         if self.is_focal_point():
             return None
         tjdut = swe.julday(when.year, when.month, when.day, 0.)
+        jultime = self.__swe_rise_trans(tjdut, location, rsmi)
+        if jultime is None:
+            return None
+        (year, month, day, tm) = swe.revjul(jultime)
+        if year != when.year or month != when.month or day != when.day:
+            return None
+        hours = int(tm)
+        minutes = (tm - hours) * 60.
+        seconds = (tm - hours - int(minutes) / 60) * 60 * 60
+        return timedelta(hours=hours, minutes=int(minutes), seconds=int(seconds))
+
+    def __swe_rise_trans(self, tjdut: float, location: GeoLocation, rsmi: int) -> float | None:
+        # swe.rise_trans sets the observer itself, keep the tracked one (and cache keys) in step with it
+        set_topo(location)
         flags = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
         rsmi |= swe.BIT_DISC_CENTER | swe.BIT_FIXED_DISC_SIZE | swe.BIT_NO_REFRACTION | swe.BIT_ASTRO_TWILIGHT
         lon = location.longitude.degrees
@@ -94,13 +253,7 @@ class Celestial(ABC):
         )
         if found != 0:
             return None
-        (year, month, day, tm) = swe.revjul(jultime)
-        if year != when.year or month != when.month or day != when.day:
-            return None
-        hours = int(tm)
-        minutes = (tm - hours) * 60.
-        seconds = (tm - hours - int(minutes) / 60) * 60 * 60
-        return timedelta(hours=hours, minutes=int(minutes), seconds=int(seconds))
+        return jultime
 
     @abstractmethod
     def swe_id(self):
@@ -122,17 +275,70 @@ class Celestial(ABC):
         pass
 
     @abstractmethod
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
+    def _swe_calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
+        """Raw swisseph 6-tuple (longitude/ra, latitude/decl, distance and their speeds)"""
         pass
 
-    @abstractmethod
-    def swe_equator_coord(self, jd, speed: bool = False, mean: bool = False) -> EquatorCoord | EclSpeed:
-        pass
+    def _calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
+        if Celestial.ephemeris is not None and not mean:
+            pos = Celestial.ephemeris.lookup(self, jd, equatorial=equatorial)
+            if pos is not None:
+                return pos
+        cache = Celestial.cache
+        if cache is None or mean or self.is_focal_point():
+            return self._swe_calc(jd, speed=speed, mean=mean, equatorial=equatorial)
+        iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
+        if equatorial:
+            iflag |= swe.FLG_EQUATORIAL
+        key = (self.swe_id(), jd, iflag | swe.FLG_SPEED if speed else iflag, current_topo())
+        if not speed and (key[0], jd, iflag | swe.FLG_SPEED, key[3]) in cache:
+            key = (key[0], jd, iflag | swe.FLG_SPEED, key[3])
+        pos = cache.get(key)
+        if pos is None:
+            pos = self._swe_calc(jd, speed=speed, mean=mean, equatorial=equatorial)
+            cache.put(key, pos)
+        return pos
+
+    def _calc_frames(self, jd, eps: float, *, speed: bool = False, mean: bool = False) -> (tuple, tuple):
+        """Ecliptic and equatorial 6-tuples from one evaluation, rotating by the true obliquity `eps`"""
+        ecl = self._calc(jd, speed=speed, mean=mean, equatorial=False)
+        return ecl, swe.cotrans_sp(ecl, -eps)
+
+    def positions(self, jd, *, frames: tuple = ("ecl", "equ"), speed: bool = False, mean: bool = False) -> dict:
+        """Coordinates in the requested frames (`"ecl"`, `"equ"`) computed with a single ephemeris evaluation"""
+        if "equ" not in frames:
+            return {"ecl": self.swe_ecl_coord(jd, speed=speed, mean=mean)}
+        if "ecl" not in frames:
+            return {"equ": self.swe_equator_coord(jd, speed=speed, mean=mean)}
+        ((eps, _, _, _, _, _), _) = swe.calc_ut(jd, swe.ECL_NUT, 0)
+        (ecl, equator) = self._calc_frames(jd, eps, speed=speed, mean=mean)
+        if speed:
+            return {"ecl": EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4]),
+                    "equ": EquatorSpeed(equator[0], equator[1], equator[3], equator[4])}
+        else:
+            return {"ecl": EclCoord(ecl[0], ecl[1]), "equ": EquatorCoord(equator[0], equator[1])}
+
+    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
+        ecl = self._calc(jd, speed=speed, mean=mean, equatorial=False)
+        if speed:
+            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
+        else:
+            return EclCoord(ecl[0], ecl[1])
+
+    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord | EquatorSpeed:
+        equator = self._calc(jd, speed=speed, mean=mean, equatorial=True)
+        if speed:
+            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
+        else:
+            return EquatorCoord(equator[0], equator[1])
 
 
 class Planet(Celestial):
     """Planets (moving physical bodies)"""
 
+    # optional `ChebyshevCache` serving planet positions
+    chebyshev = None
+
     def __init__(self, name: str, swe_code: int | NoneType = None):
         self.name = name
         self.__swe_code = swe_code or Celestial.swe_id_by_name(name)
@@ -146,39 +352,57 @@ class Planet(Celestial):
     def swe_id(self):
         return self.__swe_code
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
+    @classmethod
+    def named(cls) -> list:
+        """A `Planet` for every body of `Celestial.NAMES` but the Earth, which has no position seen from the Earth"""
+        return [cls(name) for (name, swe_code) in Celestial.NAMES.items() if swe_code != swe.EARTH]
+
+    def _calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
+        # the Chebyshev approximation is served above `Celestial.cache`, which keeps only swisseph results
+        if Planet.chebyshev is not None and not mean:
+            pos = Planet.chebyshev.lookup(self, jd, equatorial=equatorial)
+            if pos is not None:
+                return pos
+        return super()._calc(jd, speed=speed, mean=mean, equatorial=equatorial)
+
+    def _swe_calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
         if mean is not False:
             raise RuntimeError("mean position flag has no meaning for the planets")
-        iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
-        if speed:
-            iflag |= swe.FLG_SPEED
-        (ecl, _) = swe.calc_ut(jd, self.__swe_code, iflag)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
+        return self._swe_calc_ut(jd, speed=speed, equatorial=equatorial)
 
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord | EquatorSpeed:
-        if mean is not False:
-            raise RuntimeError("mean position flag has no meaning for the planets")
-        iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR | swe.FLG_EQUATORIAL
+    def _swe_calc_ut(self, jd, *, speed: bool = False, equatorial: bool = False) -> tuple:
+        iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
         if speed:
             iflag |= swe.FLG_SPEED
-        (equator, _) = swe.calc_ut(jd, self.__swe_code, iflag)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+        if equatorial:
+            iflag |= swe.FLG_EQUATORIAL
+        (pos, _) = swe.calc_ut(jd, self.__swe_code, iflag)
+        return pos
 
 
 class ApsisNode(Celestial):
     """Planet apsides and nodes"""
 
+    # order of the points in the `swe.nod_aps_ut` result and in `all_points` rows
+    POINTS = ("asc", "dsc", "peri", "apo")
+    # how many `swe.nod_aps_ut` results are kept for the other points of the same body and instant, unless
+    # `Celestial.cache` is set
+    BUNDLE_CACHE_SIZE = 256
+
+    # index of the point in the `swe.nod_aps_ut` result: ascending node, descending node, perihelion, aphelion
+    _point = None
+    _second_focus = False
+    _bundles = {}
+
     def __init__(self, name: str, swe_code: int | NoneType = None):
         self.name = name
         self.__swe_code = swe_code or Celestial.swe_id_by_name(name)
 
     def _swe_ecl_coord_nod_aps(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False, second_focus: bool = False):
+        return ApsisNode.__nod_aps(self.__swe_code, jd, speed=speed, mean=mean, equatorial=equatorial, second_focus=second_focus)
+
+    @staticmethod
+    def __nod_aps(swe_code: int, jd, *, speed: bool, mean: bool, equatorial: bool, second_focus: bool):
         method = swe.NODBIT_MEAN if mean else swe.NODBIT_OSCU
         if second_focus:
             method |= swe.NODBIT_FOPOINT
@@ -187,7 +411,47 @@ class ApsisNode(Celestial):
             iflag |= swe.FLG_SPEED
         if equatorial:
             iflag |= swe.FLG_EQUATORIAL
-        return swe.nod_aps_ut(jd, self.__swe_code, method, iflag)
+        key = (swe_code, jd, method, iflag, current_topo())
+        speed_key = (swe_code, jd, method, iflag | swe.FLG_SPEED, key[4])
+        cache = Celestial.cache
+        if cache is not None:
+            # the `PositionCache` replaces the bundle cache, so that it sees (and counts) every lookup
+            bundle = cache.get(speed_key if not speed and speed_key in cache else key)
+            if bundle is None:
+                bundle = swe.nod_aps_ut(jd, swe_code, method, iflag)
+                cache.put(key, bundle)
+            return bundle
+        bundle = ApsisNode._bundles.get(key)
+        if bundle is None and not speed:
+            bundle = ApsisNode._bundles.get(speed_key)
+        if bundle is None:
+            bundle = swe.nod_aps_ut(jd, swe_code, method, iflag)
+            if len(ApsisNode._bundles) >= ApsisNode.BUNDLE_CACHE_SIZE:
+                del ApsisNode._bundles[next(iter(ApsisNode._bundles))]
+            ApsisNode._bundles[key] = bundle
+        return bundle
+
+    @staticmethod
+    def all_points(body: Celestial | int, jds, location: GeoLocation, *, speed: bool = False, mean: bool = False,
+                   equatorial: bool = False, second_focus: bool = False) -> np.ndarray:
+        """Nodes and apsides of `body` for an array of Julian days (UT), one `swe.nod_aps_ut` call per instant.
+
+        Returns a structured array of `ECL_DTYPE` (or `EQUATOR_DTYPE`) shaped `jds.shape + (4,)`, the last axis
+        ordered as `ApsisNode.POINTS`; with `second_focus` the last point is the second focus.
+        """
+        swe_code = body if isinstance(body, int) else body.swe_id()
+        set_topo(location)
+        jds = juldays(jds)
+        shape = jds.shape
+        jds = jds.ravel()
+        out = np.empty((jds.size, 4, 6), dtype=np.float64)
+        for (i, jd) in enumerate(jds.tolist()):
+            out[i] = ApsisNode.__nod_aps(swe_code, jd, speed=speed, mean=mean, equatorial=equatorial, second_focus=second_focus)
+        return out.view(EQUATOR_DTYPE if equatorial else ECL_DTYPE).reshape(shape + (4,))
+
+    def _swe_calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
+        points = self._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=equatorial, second_focus=self._second_focus)
+        return points[self._point]
 
     def swe_id(self) -> int:
         return self.__swe_code
@@ -202,98 +466,44 @@ class ApsisNode(Celestial):
 class SecondFocus(ApsisNode):
     """Second focal point of some planet orbit"""
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
-        (_, _, _, ecl) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=False, second_focus=True)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        (_, _, _, equator) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=True, second_focus=True)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+    _point = 3
+    _second_focus = True
 
 
 class ApoApsis(ApsisNode):
     """Aphelion/apogee of some planet orbit"""
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
-        (_, _, _, ecl) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=False)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        (_, _, _, equator) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=True)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+    _point = 3
 
 
 class PeriApsis(ApsisNode):
     """Perihelion/perigee of some planet orbit"""
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
-        (_, _, ecl, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=False)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        (_, _, equator, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=True)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+    _point = 2
 
 
 class AscNode(ApsisNode):
     """Ascending node of some planet orbit"""
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
-        (ecl, _, _, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=False)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        (equator, _, _, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=True)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+    _point = 0
 
 
 class DscNode(ApsisNode):
     """Descending node of some planet orbit"""
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
-        (_, ecl, _, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=False)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        (_, equator, _, _) = super()._swe_ecl_coord_nod_aps(jd, speed=speed, mean=mean, equatorial=True)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+    _point = 1
 
 
 class FixedCelestial(Celestial):
-    """Fixed astronomical objects: stars, galactic and deep space objects"""
+    """Fixed astronomical objects: stars, galactic and deep space objects.
 
-    def __init__(self, name: str, swe_code: str):
+    `swe_code` is a star name for `swe.fixstar_ut`; for stars of a `StarCatalog` it is the sequence number of
+    the row, which is also kept as `index` (counted from 0).
+    """
+
+    def __init__(self, name: str, swe_code: str, *, index: int | NoneType = None):
         self.name = name
+        self.index = index
         self.__swe_code = swe_code
 
     def swe_id(self):
@@ -305,29 +515,16 @@ class FixedCelestial(Celestial):
     def is_focal_point(self) -> bool:
         return False
 
-    def swe_ecl_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EclCoord:
+    def _swe_calc(self, jd, *, speed: bool = False, mean: bool = False, equatorial: bool = False) -> tuple:
         if mean is not False:
             raise RuntimeError("mean position flag has no meaning for fixed objects")
         iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
         if speed:
             iflag |= swe.FLG_SPEED
-        (ecl, _, _) = swe.fixstar_ut(self.__swe_code, jd, iflag)
-        if speed:
-            return EclSpeed(ecl[0], ecl[1], ecl[3], ecl[4])
-        else:
-            return EclCoord(ecl[0], ecl[1])
-
-    def swe_equator_coord(self, jd, *, speed: bool = False, mean: bool = False) -> EquatorCoord:
-        if mean is not False:
-            raise RuntimeError("mean position flag has no meaning for fixed objects")
-        iflag = swe.FLG_SWIEPH | swe.FLG_TOPOCTR | swe.FLG_EQUATORIAL
-        if speed:
-            iflag |= swe.FLG_SPEED
-        (equator, _, _) = swe.fixstar_ut(self.__swe_code, jd, iflag)
-        if speed:
-            return EquatorSpeed(equator[0], equator[1], equator[3], equator[4])
-        else:
-            return EquatorCoord(equator[0], equator[1])
+        if equatorial:
+            iflag |= swe.FLG_EQUATORIAL
+        (pos, _, _) = swe.fixstar_ut(self.__swe_code, jd, iflag)
+        return pos
 
 
 Planet.Sun = Planet("Sun")
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+import math
+
+import numpy as np
+from numpy.polynomial import chebyshev as cheb
+import swisseph as swe
+
+from .topo import current_topo
+
+# segment lengths in days: the diurnal parallax of topocentric positions takes about six degrees of the
+# polynomial per day at the default accuracy, and these lengths need the fewest swisseph calls per day to fit
+SEGMENT_DAYS = {
+    swe.MOON: 2.0,
+    swe.JUPITER: 8.0,
+    swe.SATURN: 8.0,
+    swe.URANUS: 8.0,
+    swe.NEPTUNE: 8.0,
+    swe.PLUTO: 8.0,
+}
+SEGMENT_DAY = 4.0
+
+
+class ChebyshevCache:
+    """Chebyshev segments of planet positions fitted on first access per observer, served via `Planet.chebyshev`"""
+
+    # degrees tried in turn until the error at the check points is below `accuracy`; segments no degree fits
+    # fall back to swisseph
+    DEGREES = (8, 12, 16, 24, 32, 48, 64)
+
+    def __init__(self, *, accuracy: float = 1e-6, segment_days: float | dict | None = None, maxsize: int = 4096,
+                 start: float | None = None, end: float | None = None):
+        self.accuracy = accuracy
+        self.segment_days = segment_days
+        self.maxsize = maxsize
+        self.start = start
+        self.end = end
+        # least recently used segments are dropped beyond `maxsize`
+        self.__segments = OrderedDict()
+        self.__degrees = {}
+
+    def clear(self):
+        self.__segments.clear()
+        self.__degrees.clear()
+
+    def covers(self, jd: float) -> bool:
+        return (self.start is None or jd >= self.start) and (self.end is None or jd < self.end)
+
+    def segment_length(self, swe_id: int) -> float:
+        """Days per segment of the body: `segment_days`, a number or a dict per body, else `SEGMENT_DAYS`"""
+        if isinstance(self.segment_days, dict):
+            return self.segment_days.get(swe_id, SEGMENT_DAYS.get(swe_id, SEGMENT_DAY))
+        if self.segment_days is not None:
+            return self.segment_days
+        return SEGMENT_DAYS.get(swe_id, SEGMENT_DAY)
+
+    def lookup(self, planet, jd: float, *, equatorial: bool = False) -> tuple | None:
+        """Position and speed 6-tuple like `swe.calc_ut`, or `None` if the cache can't serve it"""
+        if not self.covers(jd):
+            return None
+        length = self.segment_length(planet.swe_id())
+        index = math.floor(jd / length)
+        key = (planet.swe_id(), equatorial, current_topo(), index)
+        if key in self.__segments:
+            segment = self.__segments[key]
+            self.__segments.move_to_end(key)
+        else:
+            segment = self.__segments[key] = self.__fit(planet, index * length, length, equatorial)
+            while len(self.__segments) > self.maxsize:
+                self.__segments.popitem(last=False)
+        if segment is None:
+            return None
+        (coeffs, deriv) = segment
+        x = 2.0 * (jd - index * length) / length - 1.0
+        pos = cheb.chebval(x, coeffs)
+        spd = cheb.chebval(x, deriv) * (2.0 / length)
+        return pos[0] % 360.0, pos[1], pos[2], spd[0], spd[1], spd[2]
+
+    def __sample(self, planet, jds: np.ndarray, equatorial: bool) -> np.ndarray:
+        pos = np.array([planet._swe_calc_ut(jd, speed=False, equatorial=equatorial)[:3] for jd in jds.tolist()])
+        pos[:, 0] = np.unwrap(pos[:, 0], period=360.0)
+        return pos
+
+    def __fit(self, planet, origin: float, length: float, equatorial: bool):
+        first = self.__degrees.get((planet.swe_id(), equatorial), 0)
+        for (i, degree) in enumerate(ChebyshevCache.DEGREES[first:], start=first):
+            nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+            pos = self.__sample(planet, origin + (nodes + 1.0) * length / 2.0, equatorial)
+            coeffs = cheb.chebfit(nodes, pos, degree)
+            checks = (nodes[:-1] + nodes[1:]) / 2.0
+            expected = self.__sample(planet, origin + (checks + 1.0) * length / 2.0, equatorial)
+            error = (cheb.chebval(checks, coeffs).T - expected)[:, :2]
+            error[:, 0] = (error[:, 0] + 180.0) % 360.0 - 180.0
+            if np.max(np.abs(error)) <= self.accuracy:
+                # a fit right at the first degree tried may also work one degree lower next time
+                self.__degrees[(planet.swe_id(), equatorial)] = i if i > first else max(i - 1, 0)
+                return coeffs, cheb.chebder(coeffs)
+        return None
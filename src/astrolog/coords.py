@@ -1,9 +1,16 @@
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 from .primitives import Angle, AngularSpeed
 from .zodiac import Zodiac, ZodiacConstell
 
+ECL_DTYPE = np.dtype([('lon', 'f8'), ('lat', 'f8'), ('dist', 'f8'),
+                      ('lon_speed', 'f8'), ('lat_speed', 'f8'), ('dist_speed', 'f8')])
+EQUATOR_DTYPE = np.dtype([('ra', 'f8'), ('decl', 'f8'), ('dist', 'f8'),
+                          ('ra_speed', 'f8'), ('decl_speed', 'f8'), ('dist_speed', 'f8')])
+HOR_DTYPE = np.dtype([('azimuth', 'f8'), ('altitude', 'f8'), ('azimuth_speed', 'f8'), ('altitude_speed', 'f8')])
 
 @dataclass
 class EclCoord:
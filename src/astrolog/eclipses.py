@@ -0,0 +1,87 @@
+"""Catalogs of solar and lunar eclipses over long ranges.
+
+Candidates are taken from the list of mean new and full moons (Meeus, Astronomical Algorithms, ch. 49
+and 54), computed at once for the whole range: a syzygy can only bring an eclipse if the Moon's argument
+of latitude puts it close enough to a node. Only these candidates go to the swisseph global eclipse
+search, started just before each one, and a search that runs past its candidate is kept for the next.
+"""
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from .timescale import juldays
+from .topo import reset_topo
+
+ECLIPSE_KINDS = ("solar", "lunar")
+ECLIPSE_DTYPE = np.dtype([
+    ('jd', 'f8'),                   # time of maximum eclipse, Julian day (UT)
+    ('kind', 'i1'),                 # index in `ECLIPSE_KINDS`
+    ('type', 'i4'),                 # swisseph `ECL_*` flags: total, annular, partial, penumbral, central...
+    ('magnitude', 'f8'),            # solar: fraction of the Sun's diameter covered, lunar: umbral magnitude
+    ('penumbral_magnitude', 'f8'),  # lunar only, NaN for solar eclipses
+])
+
+SYNODIC_MONTH = 29.530588861
+# mean new moon of 2000 January 6 (TT) and the Moon's argument of latitude then, degrees
+NEW_MOON_EPOCH = 2451550.09766
+LATITUDE_EPOCH = 160.7108
+LATITUDE_RATE = 390.67050284
+# no eclipse of either kind when the sine of the argument of latitude exceeds this
+NODE_LIMIT = 0.36
+# the swisseph search starts this many days before the mean syzygy and has to find the maximum as close
+# after it: covers the difference between the mean and the true syzygy
+WINDOW = 1.0
+
+
+def mean_syzygies(start: float, end: float, phase: float) -> (np.ndarray, np.ndarray):
+    """Mean new (`phase` 0) or full (`phase` 0.5) moons from `start` to `end` (TT) and their argument of latitude"""
+    k = np.arange(np.floor((start - NEW_MOON_EPOCH) / SYNODIC_MONTH), np.ceil((end - NEW_MOON_EPOCH) / SYNODIC_MONTH) + 1)
+    k += phase
+    t = k / 1236.85
+    jde = NEW_MOON_EPOCH + SYNODIC_MONTH * k + t * t * (0.00015437 + t * (-0.000000150 + t * 0.00000000073))
+    latitude = LATITUDE_EPOCH + LATITUDE_RATE * k + t * t * (-0.0016118 + t * (-0.00000227 + t * 0.000000011))
+    return jde, latitude
+
+
+def find_eclipses(start: datetime | float, end: datetime | float, *, kinds: tuple = ECLIPSE_KINDS) -> np.ndarray:
+    """Solar and lunar eclipses with their maximum between `start` and `end`, as an `ECLIPSE_DTYPE` array sorted by time"""
+    (start, end) = (float(juldays(start)), float(juldays(end)))
+    rows = []
+    try:
+        for kind in kinds:
+            (search, describe) = (_lunar_search, _lunar_row) if kind == "lunar" else (_solar_search, _solar_row)
+            (jde, latitude) = mean_syzygies(start - WINDOW, end + WINDOW, 0.5 if kind == "lunar" else 0.0)
+            candidates = jde[np.abs(np.sin(np.radians(latitude))) < NODE_LIMIT]
+            found = -np.inf
+            for jd in candidates.tolist():
+                jd -= swe.deltat(jd)
+                if found < jd - WINDOW:
+                    (flags, tret) = search(jd - WINDOW)
+                    found = tret[0]
+                # otherwise the previous search found nothing before `found`, past this candidate
+                if found <= jd + WINDOW and start <= found < end:
+                    rows.append(describe(found, flags))
+    finally:
+        # the swisseph eclipse routines set the topocentric observer themselves
+        reset_topo()
+    out = np.array(rows, dtype=ECLIPSE_DTYPE)
+    return out[np.argsort(out['jd'], kind='stable')]
+
+
+def _solar_search(jd: float) -> (int, tuple):
+    return swe.sol_eclipse_when_glob(jd, swe.FLG_SWIEPH)
+
+
+def _lunar_search(jd: float) -> (int, tuple):
+    return swe.lun_eclipse_when(jd, swe.FLG_SWIEPH)
+
+
+def _solar_row(jd: float, flags: int) -> tuple:
+    (_, _, attr) = swe.sol_eclipse_where(jd, swe.FLG_SWIEPH)
+    return jd, ECLIPSE_KINDS.index("solar"), flags, attr[0], np.nan
+
+
+def _lunar_row(jd: float, flags: int) -> tuple:
+    (_, attr) = swe.lun_eclipse_how(jd, (0.0, 0.0, 0.0), swe.FLG_SWIEPH)
+    return jd, ECLIPSE_KINDS.index("lunar"), flags, attr[0], attr[1]
@@ -0,0 +1,147 @@
+import math
+import os
+import struct
+
+import numpy as np
+import swisseph as swe
+
+from .celestials import Celestial, Planet, AscNode, DscNode, PeriApsis, ApoApsis, SecondFocus
+from .primitives import GeoLocation
+from .topo import set_topo, current_topo, topo_key
+
+MAGIC = b"ASTEPH\x00\x01"
+HEADER = struct.Struct("<8sIIqdd3d32s")
+BODY = struct.Struct("<ii")
+PAGE = 4096
+
+# body kinds stored in the file, the position in this list is the on-disk code
+KINDS = [Planet, AscNode, DscNode, PeriApsis, ApoApsis, SecondFocus]
+
+NODE_PLANETS = [swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN, swe.URANUS, swe.NEPTUNE]
+
+
+def ephemeris_bodies() -> [Celestial]:
+    """`Planet.named()` plus osculating nodes and apsides of the Moon and the planets"""
+    bodies = Planet.named()
+    for swe_code in NODE_PLANETS:
+        name = swe.get_planet_name(swe_code)
+        bodies += [AscNode(f"Asc {name}", swe_code), DscNode(f"Dsc {name}", swe_code),
+                   PeriApsis(f"Peri {name}", swe_code), ApoApsis(f"Apo {name}", swe_code)]
+    return bodies
+
+
+def body_key(celestial: Celestial) -> tuple | None:
+    if type(celestial) not in KINDS:
+        return None
+    return KINDS.index(type(celestial)), celestial.swe_id()
+
+
+def write_ephemeris(path: str, location: GeoLocation, start: float, end: float, *,
+                    step: float = 1.0, bodies: list | None = None) -> [Celestial]:
+    """Sample positions and speeds of `bodies` between Julian days `start` and `end` into a binary table.
+
+    Samples are topocentric for `location`, in both ecliptic and equatorial frames. Interpolation is cubic
+    Hermite on positions and speeds, so a daily step is good to arc seconds for the planets, their nodes
+    and apsides, while the Moon and its osculating nodes and apsides need hourly samples (`step=1/24`)
+    because of the diurnal parallax. Bodies swisseph cannot compute (e.g. asteroids without their ephemeris
+    file) are left out and returned. The table is written next to `path` and renamed into place when
+    complete.
+    """
+    bodies = ephemeris_bodies() if bodies is None else bodies
+    if None in (body_key(body) for body in bodies):
+        raise RuntimeError("only planets, nodes and apsides can be stored in an ephemeris file")
+    n_samples = int(math.ceil((end - start) / step)) + 1
+    jds = start + np.arange(n_samples) * step
+    set_topo(location)
+    (stored, missing) = ([], [])
+    for body in bodies:
+        try:
+            body._swe_calc(start, speed=True)
+            stored.append(body)
+        except swe.Error:
+            missing.append(body)
+    header = HEADER.pack(MAGIC, 1, len(stored), n_samples, start, step, *topo_key(location), swe.version.encode()[:32])
+    table = b"".join(BODY.pack(*body_key(body)) for body in stored)
+    offset = (HEADER.size + len(table) + PAGE - 1) // PAGE * PAGE
+    partial = f"{path}.partial"
+    try:
+        with open(partial, "wb") as file:
+            file.write(header)
+            file.write(table)
+            file.truncate(offset + len(stored) * 2 * n_samples * 6 * 8)
+        data = np.memmap(partial, dtype=np.float64, mode="r+", offset=offset, shape=(len(stored), 2, n_samples, 6))
+        for (i, body) in enumerate(stored):
+            for jd_index in range(n_samples):
+                data[i, 0, jd_index] = body._swe_calc(jds[jd_index], speed=True, equatorial=False)
+                data[i, 1, jd_index] = body._swe_calc(jds[jd_index], speed=True, equatorial=True)
+        data.flush()
+        del data
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return missing
+
+
+class EphemerisFile:
+    """Memory-mapped ephemeris table written by `write_ephemeris`.
+
+    Assign an instance to `Celestial.ephemeris` to serve positions of the stored bodies from the table
+    whenever the current observer matches the one the table was written for. The file is mapped read-only,
+    so every process using the same file shares one page-cache copy.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            head = file.read(HEADER.size)
+            (magic, _, n_bodies, n_samples, self.start, self.step, lon, lat, alt, version) = HEADER.unpack(head)
+            if magic != MAGIC:
+                raise RuntimeError(f"{path} is not an astrolog ephemeris file")
+            table = file.read(n_bodies * BODY.size)
+        self.path = path
+        self.topo = (lon, lat, alt)
+        self.swe_version = version.rstrip(b"\x00").decode()
+        self.n_samples = n_samples
+        self.end = self.start + (n_samples - 1) * self.step
+        self.index = {BODY.unpack_from(table, i * BODY.size): i for i in range(n_bodies)}
+        offset = (HEADER.size + len(table) + PAGE - 1) // PAGE * PAGE
+        self.data = np.memmap(path, dtype=np.float64, mode="r", offset=offset, shape=(n_bodies, 2, n_samples, 6))
+
+    def __contains__(self, celestial: Celestial) -> bool:
+        return body_key(celestial) in self.index
+
+    def covers(self, celestial: Celestial, jds) -> bool:
+        """Whether the table holds `celestial` for the current observer at all of the Julian days"""
+        jds = np.asarray(jds, dtype=np.float64)
+        if celestial not in self or current_topo() != self.topo:
+            return False
+        return jds.size == 0 or (self.start <= jds.min() and jds.max() <= self.end)
+
+    def lookup(self, celestial: Celestial, jd: float, *, equatorial: bool = False) -> tuple | None:
+        """Interpolated position and speed 6-tuple like `swe.calc_ut`, or `None` if the table can't serve it"""
+        if not self.covers(celestial, jd):
+            return None
+        return tuple(self.series(celestial, [jd], equatorial=equatorial)[0].tolist())
+
+    def series(self, celestial: Celestial, jds, *, equatorial: bool = False) -> np.ndarray:
+        """Interpolated `(n, 6)` positions and speeds for an array of Julian days inside the table"""
+        row = self.index[body_key(celestial)]
+        jds = np.asarray(jds, dtype=np.float64).ravel()
+        if jds.size and (jds.min() < self.start or jds.max() > self.end):
+            raise RuntimeError("Julian days outside of the ephemeris file range")
+        return self.__interpolate(self.data[row, int(equatorial)], jds)
+
+    def __interpolate(self, samples: np.ndarray, jds: np.ndarray) -> np.ndarray:
+        pos = (jds - self.start) / self.step
+        i = np.minimum(np.floor(pos).astype(np.int64), self.n_samples - 2)
+        t = (pos - i)[:, None]
+        (p0, p1) = (samples[i, :3], samples[i + 1, :3].copy())
+        (v0, v1) = (samples[i, 3:] * self.step, samples[i + 1, 3:] * self.step)
+        p1[:, 0] = p0[:, 0] + (p1[:, 0] - p0[:, 0] + 180.0) % 360.0 - 180.0
+        t2 = t * t
+        t3 = t2 * t
+        value = (2 * t3 - 3 * t2 + 1) * p0 + (t3 - 2 * t2 + t) * v0 + (-2 * t3 + 3 * t2) * p1 + (t3 - t2) * v1
+        deriv = (6 * t2 - 6 * t) * p0 + (3 * t2 - 4 * t + 1) * v0 + (-6 * t2 + 6 * t) * p1 + (3 * t2 - 2 * t) * v1
+        value[:, 0] %= 360.0
+        return np.concatenate([value, deriv / self.step], axis=1)
@@ -0,0 +1,314 @@
+"""Search for the times of events in the motion of celestials over long ranges.
+
+Every search samples positions on a coarse grid with `Celestial.ecl_series`, brackets the sign changes of
+an event function between neighbouring samples and refines all brackets at once by vectorized regula
+falsi. Times are Julian days (UT) and positions are topocentric for `location`, like elsewhere in the
+package, or geocentric where a search takes `location=None`; `start` and `end` are anything
+`timescale.juldays` accepts.
+"""
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from .celestials import Celestial, Planet
+from .coords import ECL_DTYPE
+from .primitives import GeoLocation
+from .roots import refine
+from .timescale import juldays
+from .zodiac import Zodiac
+
+# grid steps in days for the station search: two steps have to be shorter than the shortest retrograde
+# (or direct) period of the body, so no pair of stations can fall between the samples of one bracket
+STATION_STEPS = {
+    swe.MERCURY: 5.0,
+    swe.VENUS: 10.0,
+    swe.MARS: 15.0,
+    swe.JUPITER: 30.0,
+    swe.SATURN: 30.0,
+    swe.URANUS: 30.0,
+    swe.NEPTUNE: 30.0,
+    swe.PLUTO: 30.0,
+}
+STATION_STEP = 1.0
+# half interval of the central difference used as longitude speed while refining stations, days
+STATION_DELTA = 0.01
+STATION_DTYPE = np.dtype([
+    ('jd', 'f8'),           # time of the station, Julian day (UT)
+    ('lon', 'f8'),          # ecliptic longitude at the station
+    ('direction', 'i1'),    # -1 turning retrograde, +1 turning direct
+])
+
+# grid steps in days for bodies without stations, short enough for the Moon to cross at most one boundary
+INGRESS_STEPS = {
+    swe.SUN: 10.0,
+    swe.MOON: 0.5,
+}
+INGRESS_DTYPE = np.dtype([
+    ('jd', 'f8'),           # time of the boundary crossing, Julian day (UT)
+    ('from_sign', 'i1'),    # index in the partition of the sign left
+    ('to_sign', 'i1'),      # index in the partition of the sign entered
+    ('direction', 'i1'),    # +1 direct, -1 retrograde
+])
+
+# aspects as recognised by `Angle.aspect`: the circle divided by 1 (conjunction) to 13
+ASPECT_HARMONICS = tuple(range(1, 14))
+# grid steps in days for the aspect search, the smaller of both bodies' is used
+ASPECT_STEPS = {
+    swe.MOON: 0.25,
+}
+ASPECT_STEP = 1.0
+ASPECT_DTYPE = np.dtype([
+    ('jd', 'f8'),           # time of the exact aspect, Julian day (UT)
+    ('body1', 'i2'),        # index of the first body
+    ('body2', 'i2'),        # index of the second body
+    ('harmonic', 'i1'),     # the aspect is the circle divided by `harmonic`, as returned by `Angle.aspect`
+    ('angle', 'f8'),        # exact separation in longitude, degrees
+    ('applying', 'i1'),     # +1 separation shrinking, -1 growing, 0 turning (conjunction, opposition)
+])
+
+# the elongation of the Moon grows by 11 to 15 degrees a day
+LUNATION_STEP = 1.0
+LUNATION_DTYPE = np.dtype([
+    ('jd', 'f8'),           # time of the phase, Julian day (UT)
+    ('phase', 'f8'),        # elongation of the Moon from the Sun, degrees: 0 new, 90 first quarter, 180 full
+    ('sun_lon', 'f8'),      # ecliptic longitude of the Sun
+    ('moon_lon', 'f8'),     # ecliptic longitude of the Moon
+    ('sun_sign', 'i1'),     # index of the Sun's sign in `Zodiac.all`
+    ('moon_sign', 'i1'),    # index of the Moon's sign in `Zodiac.all`
+])
+
+
+def _wrap(degrees: np.ndarray) -> np.ndarray:
+    """Angles reduced to [-180, 180)"""
+    return (degrees + 180.0) % 360.0 - 180.0
+
+
+def _range(start: datetime | float, end: datetime | float) -> (float, float):
+    return float(juldays(start)), float(juldays(end))
+
+
+def _ecl_series(body: Celestial, jds: np.ndarray, location: GeoLocation | None, *, speed: bool = False) -> np.ndarray:
+    """`Celestial.ecl_series` for `location`, or geocentric positions of a planet when `location` is `None`"""
+    if location is not None:
+        return body.ecl_series(jds, location, speed=speed)
+    if not isinstance(body, Planet):
+        raise RuntimeError("geocentric positions are only computed for planets")
+    iflag = swe.FLG_SWIEPH | swe.FLG_SPEED if speed else swe.FLG_SWIEPH
+    jds = np.asarray(jds, dtype=np.float64)
+    out = np.empty((jds.size, 6), dtype=np.float64)
+    for (i, jd) in enumerate(jds.ravel().tolist()):
+        (out[i], _) = swe.calc_ut(jd, body.swe_id(), iflag)
+    return out.view(ECL_DTYPE).reshape(jds.shape)
+
+
+def _grid(start: float, end: float, step: float, margin: int = 0) -> np.ndarray:
+    """Equally spaced Julian days covering `start`..`end` with at most `step` between them, `margin` extra at each end"""
+    count = max(1, int(np.ceil((end - start) / step)))
+    step = (end - start) / count
+    return start + np.arange(-margin, count + margin + 1) * step
+
+
+def find_stations(body: Celestial, start: datetime | float, end: datetime | float,
+                  location: GeoLocation | None = None, *, step: float | None = None) -> np.ndarray:
+    """Stations of `body` (sign changes of its longitude speed) between `start` and `end`.
+
+    Returns a `STATION_DTYPE` array sorted by time. Longitudes are sampled every `step` days, by default
+    `STATION_STEPS` for the body; a turn of the longitude between samples brackets a station, which is
+    then refined on the central difference of the longitude. Stations are geocentric by default. With a
+    `location` the topocentric longitude is used, whose speed the diurnal parallax turns several times
+    around each station; one of these turns is returned, up to a day away from the geocentric station.
+    """
+    (start, end) = _range(start, end)
+    if step is None:
+        step = STATION_STEPS.get(body.swe_id(), STATION_STEP)
+    jds = _grid(start, end, step, margin=1)
+    motion = _wrap(np.diff(_ecl_series(body, jds, location)['lon']))
+    turns = np.flatnonzero(np.sign(motion[:-1]) != np.sign(motion[1:]))
+
+    def speed(t: np.ndarray, _=None) -> np.ndarray:
+        lon = _ecl_series(body, np.concatenate([t - STATION_DELTA, t + STATION_DELTA]), location)['lon']
+        return _wrap(lon[t.size:] - lon[:t.size]) / (2 * STATION_DELTA)
+
+    (a, b) = (jds[turns], jds[turns + 2])
+    # the vertex of the parabola through the three samples splits the bracket
+    (before, after) = (motion[turns], motion[turns + 1])
+    split = jds[turns + 1] + (jds[1] - jds[0]) * (before + after) / (2.0 * np.where(before != after, before - after, 1.0))
+    split = np.clip(split, a, b)
+    ends = speed(np.concatenate([a, split, b]))
+    (fa, fs, fb) = (ends[:a.size], ends[a.size:2 * a.size], ends[2 * a.size:])
+    valid = np.sign(fa) != np.sign(fb)
+    (a, b, split, fa, fs, fb) = (a[valid], b[valid], split[valid], fa[valid], fs[valid], fb[valid])
+    direction = np.where(fa > 0, -1, 1)
+    first = np.sign(fa) != np.sign(fs)
+    (a, fa) = (np.where(first, a, split), np.where(first, fa, fs))
+    (b, fb) = (np.where(first, split, b), np.where(first, fs, fb))
+    roots = refine(speed, a, b, fa, fb)
+    # a turn right on a grid point is bracketed twice
+    keep = (roots >= start) & (roots < end) & np.concatenate([[True], np.diff(roots) > STATION_DELTA])
+    out = np.zeros(np.count_nonzero(keep), dtype=STATION_DTYPE)
+    out['jd'] = roots[keep]
+    out['lon'] = _ecl_series(body, out['jd'], location)['lon']
+    out['direction'] = direction[keep]
+    return out
+
+
+def _sign_starts(partition: list) -> np.ndarray:
+    """Longitude where each sign of a `Zodiac` or `ZodiacConstell` partition begins"""
+    return np.array([sign.offset if isinstance(sign, Zodiac) else sign.from_lng for sign in partition], dtype=np.float64)
+
+
+def find_ingresses(body: Celestial, start: datetime | float, end: datetime | float, location: GeoLocation, *,
+                   partition: list = Zodiac.all, step: float | None = None) -> np.ndarray:
+    """Every crossing of a sign boundary of `partition` by `body` between `start` and `end`.
+
+    `partition` is `Zodiac.all`, `ZodiacConstell.all` or any list of their signs covering the ecliptic.
+    Returns an `INGRESS_DTYPE` array sorted by time, signs are indices in `partition`. The stations of the
+    body are added to the samples so that the longitude is monotonic between neighbouring samples, and
+    retrograde re-entries are not missed even when they happen within one grid step.
+    """
+    (start, end) = _range(start, end)
+    if step is None:
+        step = INGRESS_STEPS.get(body.swe_id(), STATION_STEPS.get(body.swe_id(), STATION_STEP))
+    jds = _grid(start, end, step)
+    lon = body.ecl_series(jds, location)['lon']
+    if body.swe_id() not in INGRESS_STEPS:
+        stations = find_stations(body, start, end, location, step=step)
+        order = np.argsort(np.concatenate([jds, stations['jd']]), kind='stable')
+        jds = np.concatenate([jds, stations['jd']])[order]
+        lon = np.concatenate([lon, stations['lon']])[order]
+    starts = _sign_starts(partition)
+    delta = _wrap(np.diff(lon))
+    # offsets of every boundary ahead of (direct) or behind (retrograde) the first sample of each interval
+    ahead = (starts[None, :] - lon[:-1, None]) % 360.0
+    behind = (lon[:-1, None] - starts[None, :]) % 360.0
+    crossed = np.where(delta[:, None] > 0, (ahead > 0) & (ahead <= delta[:, None]),
+                       (behind >= 0) & (behind < -delta[:, None]))
+    (interval, boundary) = np.nonzero(crossed)
+    direct = delta[interval] > 0
+
+    def distance(t: np.ndarray, brackets: np.ndarray) -> np.ndarray:
+        return _wrap(body.ecl_series(t, location)['lon'] - starts[boundary[brackets]])
+
+    (a, b) = (jds[interval], jds[interval + 1])
+    fa = _wrap(lon[interval] - starts[boundary])
+    fb = _wrap(lon[interval + 1] - starts[boundary])
+    roots = refine(distance, a, b, fa, fb)
+    # the sign preceding each boundary along the ecliptic
+    previous = np.argsort(starts)[(np.argsort(np.argsort(starts)) - 1) % len(starts)]
+    out = np.zeros(roots.size, dtype=INGRESS_DTYPE)
+    out['jd'] = roots
+    out['from_sign'] = np.where(direct, previous[boundary], boundary)
+    out['to_sign'] = np.where(direct, boundary, previous[boundary])
+    out['direction'] = np.where(direct, 1, -1)
+    out = out[(roots >= start) & (roots < end)]
+    return out[np.argsort(out['jd'], kind='stable')]
+
+
+def find_aspect_times(body1: Celestial | list, body2: Celestial | list, start: datetime | float,
+                      end: datetime | float, location: GeoLocation | None = None, *,
+                      harmonics: tuple = ASPECT_HARMONICS, step: float | None = None) -> np.ndarray:
+    """Exact aspects between `body1` and `body2` between `start` and `end`.
+
+    Either argument may be a list of bodies, then every pair of distinct bodies from the two lists is
+    searched once (in one order only when both lists hold it) and the positions of each body are sampled
+    only once. Separations are measured in ecliptic longitude (unlike `EclCoord.__xor__`, which includes
+    latitude), so conjunctions and oppositions become exact too. Returns an `ASPECT_DTYPE` array sorted by
+    time with `body1`/`body2` indices in the lists. `applying` tells whether the bodies close in on each
+    other through the exact aspect or draw apart. Longitudes are geocentric by default; with a `location`
+    they are topocentric, and the lunar parallax moves aspects of the Moon by up to two hours.
+    """
+    (start, end) = _range(start, end)
+    firsts = body1 if isinstance(body1, list) else [body1]
+    seconds = body2 if isinstance(body2, list) else [body2]
+    bodies = list(dict.fromkeys(firsts + seconds))
+    if step is None:
+        step = min(ASPECT_STEPS.get(body.swe_id(), ASPECT_STEP) for body in bodies)
+    jds = _grid(start, end, step)
+    (targets, target_harmonics) = _aspect_targets(harmonics)
+    parts = []
+    for (i, j, roots, target, widening) in _separation_crossings(firsts, seconds, jds, location, targets):
+        widening[np.abs(targets[target]) % 180.0 == 0.0] = 0
+        part = np.zeros(roots.size, dtype=ASPECT_DTYPE)
+        part['jd'] = roots
+        (part['body1'], part['body2']) = (i, j)
+        part['harmonic'] = target_harmonics[target]
+        part['angle'] = np.abs(targets[target])
+        part['applying'] = -widening
+        parts.append(part[(roots >= start) & (roots < end)])
+    out = np.concatenate(parts) if parts else np.zeros(0, dtype=ASPECT_DTYPE)
+    return out[np.argsort(out['jd'], kind='stable')]
+
+
+def _aspect_targets(harmonics: tuple) -> (np.ndarray, np.ndarray):
+    """Signed longitude differences of exact aspects and their harmonics"""
+    (targets, target_harmonics) = ([], [])
+    for h in harmonics:
+        angle = 360.0 / h if h > 1 else 0.0
+        # both sides except for conjunction and opposition
+        for target in dict.fromkeys([_wrap(angle), _wrap(-angle)]):
+            targets.append(target)
+            target_harmonics.append(h)
+    return np.array(targets), np.array(target_harmonics)
+
+
+def _separation_crossings(firsts: list, seconds: list, jds: np.ndarray, location: GeoLocation | None,
+                          targets: np.ndarray):
+    """Times when the signed longitude difference of two bodies passes one of `targets`, sampled on `jds`.
+
+    Yields `(i, j, roots, target, widening)` for every pair of distinct bodies of `firsts` and `seconds`
+    (searched once when both lists hold it): indices of the bodies, refined times, indices in `targets`
+    and the sign of the change of the difference times the sign of the target. Positions of each body are
+    sampled only once.
+    """
+    lon = {body: _ecl_series(body, jds, location)['lon'] for body in dict.fromkeys(firsts + seconds)}
+    searched = set()
+    for (i, first) in enumerate(firsts):
+        for (j, second) in enumerate(seconds):
+            if first is second or (second, first) in searched:
+                continue
+            searched.add((first, second))
+            diff = _wrap(lon[first] - lon[second])
+            values = _wrap(diff[:, None] - targets[None, :])
+            crossed = (np.sign(values[:-1]) != np.sign(values[1:])) & (np.abs(values[1:] - values[:-1]) < 180.0)
+            (interval, target) = np.nonzero(crossed)
+
+            def distance(t: np.ndarray, brackets: np.ndarray, first=first, second=second, target=target) -> np.ndarray:
+                separation = _ecl_series(first, t, location)['lon'] - _ecl_series(second, t, location)['lon']
+                return _wrap(separation - targets[target[brackets]])
+
+            roots = refine(distance, jds[interval], jds[interval + 1], values[interval, target], values[interval + 1, target])
+            widening = np.sign(values[interval + 1, target] - values[interval, target]) * np.sign(targets[target])
+            yield i, j, roots, target, widening
+
+
+def find_lunations(start: datetime | float, end: datetime | float, location: GeoLocation | None = None, *,
+                   phases: tuple = (0, 90, 180, 270)) -> np.ndarray:
+    """Times when the elongation of the Moon from the Sun reaches each of `phases` between `start` and `end`.
+
+    Returns a `LUNATION_DTYPE` array sorted by time with the positions and signs of both bodies. The
+    elongation is geocentric by default, like in published tables; with a `location` it is measured in
+    topocentric longitude, where the lunar parallax moves the times by up to two hours.
+    """
+    (start, end) = _range(start, end)
+    (sun, moon) = (Planet.Sun, Planet.Moon)
+    jds = _grid(start, end, LUNATION_STEP)
+    elongation = _ecl_series(moon, jds, location)['lon'] - _ecl_series(sun, jds, location)['lon']
+    targets = np.asarray(phases, dtype=np.float64)
+    values = _wrap(elongation[:, None] - targets[None, :])
+    crossed = (values[:-1] < 0) & (values[1:] >= 0) & (values[1:] - values[:-1] < 180.0)
+    (interval, target) = np.nonzero(crossed)
+
+    def distance(t: np.ndarray, brackets: np.ndarray) -> np.ndarray:
+        return _wrap(_ecl_series(moon, t, location)['lon'] - _ecl_series(sun, t, location)['lon'] - targets[target[brackets]])
+
+    roots = refine(distance, jds[interval], jds[interval + 1], values[interval, target], values[interval + 1, target])
+    keep = (roots >= start) & (roots < end)
+    out = np.zeros(np.count_nonzero(keep), dtype=LUNATION_DTYPE)
+    out['jd'] = roots[keep]
+    out['phase'] = targets[target[keep]]
+    out['sun_lon'] = _ecl_series(sun, out['jd'], location)['lon']
+    out['moon_lon'] = _ecl_series(moon, out['jd'], location)['lon']
+    out['sun_sign'] = (out['sun_lon'] // 30.0) % 12
+    out['moon_sign'] = (out['moon_lon'] // 30.0) % 12
+    return out[np.argsort(out['jd'], kind='stable')]
@@ -0,0 +1,332 @@
+"""Precomputed event indexes answering date queries without ephemeris calls.
+
+Each index is built once over a span with the searches of `events` and can be saved to and loaded from
+a NumPy `.npz` file. Queries are binary searches on sorted arrays of Julian days (UT). Bodies swisseph
+has no ephemeris file for are left out of an index and listed in its `missing`.
+"""
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from .celestials import Celestial, Planet
+from .events import (ASPECT_HARMONICS, ASPECT_STEP, ASPECT_STEPS, _aspect_targets, _ecl_series, _grid,
+                     _separation_crossings, _sign_starts, _wrap, find_ingresses, find_stations)
+from .primitives import GeoLocation
+from .timescale import juldays
+from .topo import topo_key
+from .zodiac import Zodiac, ZodiacConstell
+
+PARTITIONS = {
+    "zodiac": Zodiac.all,
+    "constell": ZodiacConstell.all,
+}
+
+RETROGRADE_DTYPE = np.dtype([
+    ('start', 'f8'),        # station turning retrograde, Julian day (UT); the span start for an open period
+    ('end', 'f8'),          # station turning direct; the span end for an open period
+    ('start_lon', 'f8'),    # ecliptic longitude at `start`
+    ('end_lon', 'f8'),      # ecliptic longitude at `end`
+])
+# bodies never moving retrograde, left out of `RetrogradeIndex`
+NEVER_RETROGRADE = (swe.SUN, swe.MOON)
+
+ASPECT_INDEX_DTYPE = np.dtype([
+    ('jd', 'f8'),           # time of the exact aspect, Julian day (UT)
+    ('enter', 'f8'),        # the separation comes within the orb; the span start when it already is
+    ('leave', 'f8'),        # the separation leaves the orb; the span end when it still is within
+    ('body1', 'i1'),        # index of the first body in `AspectIndex.bodies`
+    ('body2', 'i1'),        # index of the second body
+    ('harmonic', 'i1'),     # the aspect is the circle divided by `harmonic`, as returned by `Angle.aspect`
+    ('applying', 'i1'),     # +1 separation shrinking, -1 growing, 0 turning (conjunction, opposition)
+])
+
+
+def _body_id(body: Celestial | int) -> int:
+    return body if isinstance(body, int) else body.swe_id()
+
+
+class SignIndex:
+    """Intervals of sign occupancy of each body for `Zodiac` signs and `ZodiacConstell` constellations.
+
+    Per body and partition the index holds the sorted times when a sign is entered (the first one being
+    the start of the span) and the sign entered, as an index in `PARTITIONS[partition]`.
+    """
+
+    def __init__(self, start: float, end: float, topo: tuple, intervals: dict, missing: list | None = None):
+        self.start = start
+        self.end = end
+        self.topo = topo
+        self.intervals = intervals
+        self.missing = missing or []
+
+    @classmethod
+    def build(cls, start: datetime | float, end: datetime | float, location: GeoLocation, *,
+              bodies: list | None = None, partitions: tuple = tuple(PARTITIONS)):
+        """Find every ingress of `bodies` (by default `Planet.named()`) between `start` and `end`"""
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        (intervals, missing) = ({}, [])
+        for body in Planet.named() if bodies is None else bodies:
+            try:
+                first = body.ecl_series(np.array([start]), location)['lon'][0]
+                for partition in partitions:
+                    signs = PARTITIONS[partition]
+                    ingresses = find_ingresses(body, start, end, location, partition=signs)
+                    starts = np.concatenate([[start], ingresses['jd']])
+                    entered = np.concatenate([[SignIndex.__sign_of(first, signs)], ingresses['to_sign']]).astype(np.int8)
+                    intervals[(body.swe_id(), partition)] = (starts, entered)
+            except swe.Error:
+                missing.append(body.swe_id())
+        return cls(start, end, topo_key(location), intervals, missing)
+
+    @staticmethod
+    def __sign_of(longitude: float, signs: list) -> int:
+        starts = _sign_starts(signs)
+        order = np.argsort(starts)
+        return int(order[(np.searchsorted(starts[order], longitude, side='right') - 1) % len(signs)])
+
+    def save(self, path: str):
+        arrays = {'span': np.array([self.start, self.end]), 'topo': np.array(self.topo),
+                  'missing': np.array(self.missing, dtype=np.int64)}
+        for ((swe_id, partition), (starts, signs)) in self.intervals.items():
+            arrays[f"{swe_id}/{partition}/starts"] = starts
+            arrays[f"{swe_id}/{partition}/signs"] = signs
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            intervals = {}
+            for name in data.files:
+                if name.endswith("/starts"):
+                    (swe_id, partition, _) = name.split("/")
+                    intervals[(int(swe_id), partition)] = (data[name], data[f"{swe_id}/{partition}/signs"])
+            (start, end) = data['span'].tolist()
+            return cls(start, end, tuple(data['topo'].tolist()), intervals, data['missing'].tolist())
+
+    def __intervals(self, body: Celestial | int, partition: str) -> (np.ndarray, np.ndarray):
+        intervals = self.intervals.get((_body_id(body), partition))
+        if intervals is None:
+            raise RuntimeError(f"body {_body_id(body)} is not indexed for {partition}")
+        return intervals
+
+    def sign_index(self, body: Celestial | int, jds, partition: str = "zodiac") -> np.ndarray:
+        """Index in `PARTITIONS[partition]` of the sign occupied at each of `jds`, -1 outside the span"""
+        (starts, signs) = self.__intervals(body, partition)
+        jds = juldays(jds)
+        result = signs[np.clip(np.searchsorted(starts, jds, side='right') - 1, 0, None)].astype(np.int64)
+        return np.where((jds >= self.start) & (jds < self.end), result, -1)
+
+    def sign_at(self, body: Celestial | int, time: datetime | float, partition: str = "zodiac") -> Zodiac | ZodiacConstell | None:
+        index = int(self.sign_index(body, time, partition))
+        return None if index < 0 else PARTITIONS[partition][index]
+
+    def periods(self, body: Celestial | int, sign: Zodiac | ZodiacConstell, start: datetime | float,
+                end: datetime | float, partition: str = "zodiac") -> np.ndarray:
+        """`(entered, left)` rows of the stays of `body` in `sign` overlapping `start`..`end`, clipped to it"""
+        (starts, signs) = self.__intervals(body, partition)
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        first = max(int(np.searchsorted(starts, start, side='right')) - 1, 0)
+        last = int(np.searchsorted(starts, end, side='left'))
+        ends = np.append(starts[first + 1:last + 1], self.end)[:last - first]
+        selected = signs[first:last] == PARTITIONS[partition].index(sign)
+        rows = np.stack([starts[first:last][selected], ends[selected]], axis=1)
+        return np.clip(rows, start, end)
+
+
+class RetrogradeIndex:
+    """Retrograde periods of each body, between its stations, as a `RETROGRADE_DTYPE` array sorted by time.
+
+    Periods of one body do not overlap, so both their starts and their ends are sorted and membership and
+    overlap queries for arrays of dates are answered with `searchsorted`. Stations are geocentric unless the
+    index is built for a location (`topo` is then its observer), see `events.find_stations`.
+    """
+
+    def __init__(self, start: float, end: float, topo: tuple | None, periods: dict, missing: list | None = None):
+        self.start = start
+        self.end = end
+        self.topo = topo
+        self.periods = periods
+        self.missing = missing or []
+
+    @classmethod
+    def build(cls, start: datetime | float, end: datetime | float, location: GeoLocation | None = None, *,
+              bodies: list | None = None):
+        """Find the stations of `bodies` (by default `Planet.named()` but the luminaries) between `start` and `end`"""
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        if bodies is None:
+            bodies = [body for body in Planet.named() if body.swe_id() not in NEVER_RETROGRADE]
+        (periods, missing) = ({}, [])
+        for body in bodies:
+            try:
+                periods[body.swe_id()] = RetrogradeIndex.__periods(body, start, end, location)
+            except swe.Error:
+                missing.append(body.swe_id())
+        return cls(start, end, None if location is None else topo_key(location), periods, missing)
+
+    @staticmethod
+    def __periods(body: Celestial, start: float, end: float, location: GeoLocation | None) -> np.ndarray:
+        stations = find_stations(body, start, end, location)
+        (jd, lon, direction) = (stations['jd'], stations['lon'], stations['direction'])
+        (first, last) = _ecl_series(body, np.array([start, end]), location, speed=True)
+        # a period already running at the span start, or still running at its end, is closed there
+        retrograde = direction[0] > 0 if direction.size else first['lon_speed'] < 0
+        if retrograde:
+            (jd, lon) = (np.append(start, jd), np.append(first['lon'], lon))
+        if jd.size % 2:
+            (jd, lon) = (np.append(jd, end), np.append(lon, last['lon']))
+        out = np.zeros(jd.size // 2, dtype=RETROGRADE_DTYPE)
+        (out['start'], out['end']) = (jd[0::2], jd[1::2])
+        (out['start_lon'], out['end_lon']) = (lon[0::2], lon[1::2])
+        return out
+
+    def save(self, path: str):
+        arrays = {'span': np.array([self.start, self.end]), 'topo': np.array(self.topo or (), dtype=np.float64),
+                  'missing': np.array(self.missing, dtype=np.int64)}
+        for (swe_id, periods) in self.periods.items():
+            arrays[str(swe_id)] = periods
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            periods = {int(name): data[name] for name in data.files if name.isdigit()}
+            (start, end) = data['span'].tolist()
+            return cls(start, end, tuple(data['topo'].tolist()) or None, periods, data['missing'].tolist())
+
+    def __periods_of(self, body: Celestial | int) -> np.ndarray:
+        periods = self.periods.get(_body_id(body))
+        if periods is None:
+            raise RuntimeError(f"body {_body_id(body)} is not indexed")
+        return periods
+
+    def __check_span(self, jds: np.ndarray):
+        if np.any((jds < self.start) | (jds > self.end)):
+            raise RuntimeError("dates outside the indexed span")
+
+    def is_retrograde(self, body: Celestial | int, jds) -> np.ndarray:
+        """Whether `body` is retrograde at each of `jds`"""
+        periods = self.__periods_of(body)
+        jds = juldays(jds)
+        self.__check_span(jds)
+        index = np.searchsorted(periods['start'], jds, side='right') - 1
+        return (index >= 0) & (jds < periods['end'][np.clip(index, 0, None)])
+
+    def overlaps(self, body: Celestial | int, starts, ends) -> np.ndarray:
+        """Whether a retrograde period of `body` overlaps each of the windows `starts`..`ends`"""
+        periods = self.__periods_of(body)
+        (starts, ends) = (juldays(starts), juldays(ends))
+        self.__check_span(starts)
+        self.__check_span(ends)
+        # periods begun before the window ends, less those over before it starts
+        return np.searchsorted(periods['start'], ends, side='left') > np.searchsorted(periods['end'], starts, side='right')
+
+    def between(self, body: Celestial | int, start: datetime | float, end: datetime | float) -> np.ndarray:
+        """Retrograde periods of `body` overlapping `start`..`end`"""
+        periods = self.__periods_of(body)
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        return periods[np.searchsorted(periods['end'], start, side='right'):np.searchsorted(periods['start'], end, side='left')]
+
+
+class AspectIndex:
+    """Exact aspects between every pair of bodies over a span, with the times the separation stays within orb.
+
+    Entries are grouped by pair (`pairs`, `offsets` into `events`). With orbs smaller than half the gap
+    between neighbouring aspect angles, the stays within orb of one pair never overlap, so within a pair
+    the exact times, entries and exits are all sorted and a window is cut out with binary searches.
+    Exact aspects met again within one stay in orb (around stations) share its entry and exit. Longitudes
+    are geocentric unless the index is built for a location (`topo` is then its observer), see
+    `events.find_aspect_times`.
+    """
+
+    def __init__(self, start: float, end: float, topo: tuple | None, orb: float, bodies: np.ndarray,
+                 pairs: np.ndarray, offsets: np.ndarray, events: np.ndarray):
+        self.start = start
+        self.end = end
+        self.topo = topo
+        self.orb = orb
+        self.bodies = bodies
+        self.pairs = pairs
+        self.offsets = offsets
+        self.events = events
+
+    @classmethod
+    def build(cls, start: datetime | float, end: datetime | float, location: GeoLocation | None = None, *,
+              bodies: list | None = None, harmonics: tuple = ASPECT_HARMONICS, orb: float = 0.5,
+              step: float | None = None):
+        """Find the exact aspects of all pairs of `bodies` (by default `Planet.novile` and Pluto) and their orbs"""
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        if bodies is None:
+            bodies = Planet.novile + [Planet.Pluto]
+        if step is None:
+            step = min(ASPECT_STEPS.get(body.swe_id(), ASPECT_STEP) for body in bodies)
+        (exact, target_harmonics) = _aspect_targets(harmonics)
+        gaps = np.diff(np.sort(exact), append=np.min(exact) + 360.0)
+        if 2 * orb >= np.min(gaps):
+            raise RuntimeError(f"orb {orb} is too wide, the orbs of neighbouring aspects overlap")
+        # entering and leaving the orb are crossings of the aspect angle shifted by the orb
+        targets = np.concatenate([exact, _wrap(exact - orb), _wrap(exact + orb)])
+        (pairs, parts) = ([], [])
+        for (i, j, roots, target, widening) in _separation_crossings(bodies, bodies, _grid(start, end, step), location, targets):
+            (base, crossing) = (target % exact.size, target < exact.size)
+            widening[np.abs(exact[base]) % 180.0 == 0.0] = 0
+            part = np.zeros(np.count_nonzero(crossing), dtype=ASPECT_INDEX_DTYPE)
+            (part['jd'], part['harmonic'], part['applying']) = (roots[crossing], target_harmonics[base[crossing]], -widening[crossing])
+            (part['body1'], part['body2']) = (i, j)
+            for k in np.unique(base[crossing]):
+                bounds = np.concatenate([[start], np.sort(roots[~crossing & (base == k)]), [end]])
+                selected = base[crossing] == k
+                after = np.clip(np.searchsorted(bounds, part['jd'][selected]), 1, bounds.size - 1)
+                (part['enter'][selected], part['leave'][selected]) = (bounds[after - 1], bounds[after])
+            part = part[(part['jd'] >= start) & (part['jd'] < end)]
+            part['enter'] = np.clip(part['enter'], start, None)
+            part['leave'] = np.clip(part['leave'], None, end)
+            pairs.append((i, j))
+            parts.append(part[np.argsort(part['jd'], kind='stable')])
+        offsets = np.cumsum([0] + [part.size for part in parts])
+        events = np.concatenate(parts) if parts else np.zeros(0, dtype=ASPECT_INDEX_DTYPE)
+        topo = None if location is None else topo_key(location)
+        return cls(start, end, topo, orb, np.array([body.swe_id() for body in bodies]),
+                   np.array(pairs, dtype=np.int8).reshape(-1, 2), offsets, events)
+
+    def save(self, path: str):
+        np.savez_compressed(path, span=np.array([self.start, self.end]), topo=np.array(self.topo or (), dtype=np.float64),
+                            orb=self.orb, bodies=self.bodies, pairs=self.pairs, offsets=self.offsets, events=self.events)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            (start, end) = data['span'].tolist()
+            return cls(start, end, tuple(data['topo'].tolist()) or None, float(data['orb']), data['bodies'],
+                       data['pairs'], data['offsets'], data['events'])
+
+    def __selected_pairs(self, body1, body2) -> np.ndarray:
+        selected = np.ones(len(self.pairs), dtype=bool)
+        for body in (body1, body2):
+            if body is not None:
+                index = np.flatnonzero(self.bodies == _body_id(body))
+                if index.size == 0:
+                    raise RuntimeError(f"body {_body_id(body)} is not indexed")
+                selected &= (self.pairs == index[0]).any(axis=1)
+        return np.flatnonzero(selected)
+
+    def between(self, start: datetime | float, end: datetime | float, *, body1: Celestial | int | None = None,
+                body2: Celestial | int | None = None, harmonics: tuple | None = None, exact: bool = False) -> np.ndarray:
+        """Aspects within orb at some time between `start` and `end`, or with `exact`, exact in that window.
+
+        `body1`/`body2` restrict the pairs to those with these bodies. Returns `ASPECT_INDEX_DTYPE` rows
+        sorted by exact time.
+        """
+        (start, end) = (float(juldays(start)), float(juldays(end)))
+        parts = []
+        for pair in self.__selected_pairs(body1, body2):
+            events = self.events[self.offsets[pair]:self.offsets[pair + 1]]
+            if exact:
+                (first, last) = (np.searchsorted(events['jd'], start, side='left'), np.searchsorted(events['jd'], end, side='left'))
+            else:
+                (first, last) = (np.searchsorted(events['leave'], start, side='left'), np.searchsorted(events['enter'], end, side='right'))
+            parts.append(events[first:last])
+        out = np.concatenate(parts) if parts else np.zeros(0, dtype=ASPECT_INDEX_DTYPE)
+        if harmonics is not None:
+            out = out[np.isin(out['harmonic'], harmonics)]
+        return out[np.argsort(out['jd'], kind='stable')]
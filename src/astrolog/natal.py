@@ -5,35 +5,51 @@ from .celestials import Celestial
 from .primitives import GeoLocation
 from .coords import HorCoord, EclCoord, EquatorCoord, EclSpeed
 from .zodiac import Zodiac, ZodiacConstell
+from .snapshot import SkySnapshot
+from .topo import set_topo
+from .timescale import julday
 
 
 class NatalObject:
     """Natal object computable type"""
 
-    def __init__(self, obj: Celestial, birth: datetime, place: GeoLocation):
+    def __init__(self, obj: Celestial, birth: datetime, place: GeoLocation, snapshot: SkySnapshot | None = None):
         self.name = obj.name
         self.obj = obj
         self.birth = birth
         self.place = place
+        self.snapshot = snapshot
         self.__ecl_coord = None
         self.__equator_coord = None
         self.__transits = None
 
     def julday(self) -> float:
-        return swe.julday(self.birth.year, self.birth.month, self.birth.day, self.birth.hour + self.birth.minute / 60.)
+        return julday(self.birth)
 
     def ecl_coord(self, *, speed: bool = False, mean: bool = False) -> EclCoord | EclSpeed:
+        if self.__ecl_coord is None and not mean and self.snapshot is not None \
+                and self.snapshot.covers(self.obj, "ecl", speed=speed):
+            self.__ecl_coord = self.snapshot.ecl_coord(self.obj, speed=speed)
         if self.__ecl_coord is None:
-            swe.set_topo(self.place.longitude.degrees, self.place.latitude.degrees)
-            self.__ecl_coord = self.obj.swe_ecl_coord(self.julday(), speed=speed, mean=mean)
+            self.__positions(speed=speed, mean=mean)
         return self.__ecl_coord
 
     def equator_coord(self, *, speed: bool = False, mean: bool = False) -> EquatorCoord | EquatorCoord:
+        if self.__equator_coord is None and not mean and self.snapshot is not None \
+                and self.snapshot.covers(self.obj, "equ", speed=speed):
+            self.__equator_coord = self.snapshot.equator_coord(self.obj, speed=speed)
         if self.__equator_coord is None:
-            swe.set_topo(self.place.longitude.degrees, self.place.latitude.degrees)
-            self.__equator_coord = self.obj.swe_equator_coord(self.julday(), speed=speed, mean=mean)
+            self.__positions(speed=speed, mean=mean)
         return self.__equator_coord
 
+    def __positions(self, *, speed: bool, mean: bool):
+        set_topo(self.place)
+        coords = self.obj.positions(self.julday(), speed=speed, mean=mean)
+        if self.__ecl_coord is None:
+            self.__ecl_coord = coords["ecl"]
+        if self.__equator_coord is None:
+            self.__equator_coord = coords["equ"]
+
     def hor_coord(self) -> HorCoord:
         coord = self.ecl_coord()
         geopos = (self.place.longitude.degrees, self.place.latitude.degrees, 0.0)
@@ -61,11 +77,17 @@ class NatalObject:
 class Natal:
     """Natal chart"""
 
-    def __init__(self, person: str, birth: datetime, place: GeoLocation, celestials: [Celestial]):
+    def __init__(self, person: str, birth: datetime, place: GeoLocation, celestials: [Celestial], *,
+                 snapshot: SkySnapshot | None = None):
+        celestials = list(celestials)
         self.person = person
         self.birth = birth
         self.place = place
-        self.celestials = {obj: NatalObject(obj, birth, place) for obj in celestials}
+        if snapshot is None:
+            jd = julday(birth)
+            snapshot = SkySnapshot(jd, place, celestials)
+        self.snapshot = snapshot
+        self.celestials = {obj: NatalObject(obj, birth, place, self.snapshot) for obj in celestials}
 
     def __iter__(self):
         for cel in self.celestials:
@@ -0,0 +1,129 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from .celestials import Celestial
+from .coords import EclCoord, EquatorCoord, EclSpeed, EquatorSpeed, ECL_DTYPE, EQUATOR_DTYPE
+from .natal import Natal
+from .primitives import GeoLocation
+from .snapshot import SkySnapshot
+from .topo import reset_topo, group_by_location, set_topo
+from .timescale import julday, juldays
+
+
+def _init_worker(ephe_path: str | None):
+    reset_topo()
+    # a forked worker inherits the lock and the SQLite connection of the parent, which it must not share
+    if Celestial.cache is not None:
+        Celestial.cache.reopen()
+    if ephe_path is not None:
+        swe.set_ephe_path(ephe_path)
+
+
+def _snapshot_task(jd: float, place: GeoLocation, celestials: list, frames: tuple):
+    snapshot = SkySnapshot(jd, place, celestials, frames=frames)
+    return snapshot.ecl, snapshot.equator
+
+
+def _series_task(celestial: Celestial, jds: np.ndarray, location: GeoLocation, equatorial: bool, speed: bool, mean: bool):
+    set_topo(location)
+    return celestial._swe_series(jds, speed=speed, mean=mean, equatorial=equatorial)
+
+
+def _coords_task(requests: list, equatorial: bool, speed: bool, mean: bool) -> list:
+    results = [None] * len(requests)
+    for (location, group) in group_by_location(enumerate(requests), lambda item: item[1][2]):
+        set_topo(location)
+        for (i, (obj, jd, _)) in group:
+            results[i] = tuple(obj._calc(jd, speed=speed, mean=mean, equatorial=equatorial))
+    return results
+
+
+def _chain(future: Future, convert) -> Future:
+    result = Future()
+
+    def done(f: Future):
+        try:
+            result.set_result(convert(f.result()))
+        except BaseException as e:
+            result.set_exception(e)
+    future.add_done_callback(done)
+    return result
+
+
+def _gather(futures: [Future], combine) -> Future:
+    result = Future()
+    pending = [len(futures)]
+
+    def done(_):
+        pending[0] -= 1
+        if pending[0] != 0:
+            return
+        try:
+            result.set_result(combine([f.result() for f in futures]))
+        except BaseException as e:
+            result.set_exception(e)
+    if not futures:
+        result.set_result(combine([]))
+    for f in futures:
+        f.add_done_callback(done)
+    return result
+
+
+class EphemerisPool:
+    """Pool of worker processes, each owning its own swisseph state.
+
+    swisseph keeps the observer and ephemeris path in process globals, so the pool is the way to compute
+    charts and positions concurrently: every call returns a `concurrent.futures.Future` and the pool itself
+    is safe to share between threads. Small requests are grouped into chunks of `chunksize` per round-trip.
+    """
+
+    def __init__(self, workers: int | None = None, *, ephe_path: str | None = None, chunksize: int = 256):
+        self.chunksize = chunksize
+        self.__executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ephe_path,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
+
+    def shutdown(self, wait: bool = True):
+        self.__executor.shutdown(wait=wait)
+
+    def submit_natal(self, person: str, birth: datetime, place: GeoLocation, celestials: [Celestial]) -> Future:
+        """Future of a `Natal` whose positions were computed in a worker"""
+        jd = julday(birth)
+        future = self.__executor.submit(_snapshot_task, jd, place, celestials, SkySnapshot.FRAMES)
+        return _chain(future, lambda arrays: Natal(person, birth, place, celestials, snapshot=SkySnapshot.from_arrays(
+            jd, place, celestials, ecl=arrays[0], equator=arrays[1])))
+
+    def map_positions(self, celestial: Celestial, jds, location: GeoLocation, *,
+                      equatorial: bool = False, speed: bool = False, mean: bool = False) -> Future:
+        """Future of `Celestial.ecl_series`/`equator_series`, split in chunks across the workers"""
+        jds = juldays(jds)
+        shape = jds.shape
+        flat = jds.ravel()
+        futures = [self.__executor.submit(_series_task, celestial, flat[i:i + self.chunksize], location, equatorial, speed, mean)
+                   for i in range(0, flat.size, self.chunksize)]
+        dtype = EQUATOR_DTYPE if equatorial else ECL_DTYPE
+        return _gather(futures, lambda parts: np.concatenate(parts or [np.empty((0, 6))]).view(dtype).reshape(shape))
+
+    def map_coords(self, requests: list, *, equatorial: bool = False, speed: bool = False, mean: bool = False) -> [Future]:
+        """Futures of `EclCoord`/`EquatorCoord` for `(celestial, time, location)` requests, one per request"""
+        requests = [(obj, julday(time), location) for (obj, time, location) in requests]
+        futures = []
+        for i in range(0, len(requests), self.chunksize):
+            chunk = self.__executor.submit(_coords_task, requests[i:i + self.chunksize], equatorial, speed, mean)
+            for j in range(len(requests[i:i + self.chunksize])):
+                futures.append(_chain(chunk, lambda results, j=j: self.__coord(results[j], equatorial, speed)))
+        return futures
+
+    @staticmethod
+    def __coord(pos: tuple, equatorial: bool, speed: bool) -> EclCoord | EquatorCoord:
+        if equatorial:
+            return EquatorSpeed(pos[0], pos[1], pos[3], pos[4]) if speed else EquatorCoord(pos[0], pos[1])
+        return EclSpeed(pos[0], pos[1], pos[3], pos[4]) if speed else EclCoord(pos[0], pos[1])
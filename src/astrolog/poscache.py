@@ -0,0 +1,264 @@
+from collections import OrderedDict
+import sqlite3
+import threading
+
+import numpy as np
+import swisseph as swe
+
+
+class PositionCache:
+    """Process-wide LRU cache of raw swisseph position results.
+
+    The cache is opt-in: assign an instance to `Celestial.cache` and every position computed by swisseph
+    for a `Celestial` is kept under `(swe id, jd, flags, observer)`, nodes and apsides as whole
+    `swe.nod_aps_ut` results under `(swe id, jd, method, flags, observer)`. At most `maxsize` entries are
+    kept, the least recently used one is evicted first. The counters are meant for sizing the cache
+    against real traffic. With a `backing` store (`DiskPositionCache`) misses are looked up there before
+    swisseph is called, and new results are written through to it. The cache is safe to use from several
+    threads; a forked process has to `reopen` it before use.
+    """
+
+    def __init__(self, maxsize: int = 65536, *, backing=None):
+        if maxsize < 1:
+            raise RuntimeError("cache size has to be positive")
+        self.maxsize = maxsize
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self.__entries
+
+    def get(self, key: tuple):
+        """Cached result for `key` marked as most recently used, or `None`; counts a hit or a miss"""
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        if self.backing is not None:
+            value = self.backing.get(key)
+            if value is not None:
+                self.__store(key, value)
+        return value
+
+    def put(self, key: tuple, value):
+        self.__store(key, value)
+        if self.backing is not None:
+            self.backing.put(key, value)
+
+    def preload(self, limit: int | None = None) -> int:
+        """Fill the cache with up to `limit` (default `maxsize`) of the newest entries of the backing store"""
+        if self.backing is None:
+            return 0
+        count = 0
+        for (key, value) in self.backing.entries(limit=self.maxsize if limit is None else limit):
+            self.__store(key, value)
+            count += 1
+        return count
+
+    def reopen(self):
+        """Renew the lock, and the connection of the backing store, in a forked process"""
+        self.__lock = threading.Lock()
+        if self.backing is not None:
+            self.backing.reopen()
+
+    def __store(self, key: tuple, value):
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries, the counters are kept"""
+        with self.__lock:
+            self.__entries.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        stats = {
+            'size': len(self.__entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+        if self.backing is not None:
+            stats['backing'] = self.backing.stats()
+        return stats
+
+
+class DiskPositionCache:
+    """Persistent SQLite store of swisseph position results, the second tier behind a `PositionCache`.
+
+    Entries are keyed like in `PositionCache`, split into typed columns, plus `version`, by default the
+    swisseph version, so a file written with another ephemeris is not used; pass a version naming the
+    ephemeris files in use when they change independently. Writes are buffered and committed `batch_size`
+    at a time in one transaction; `flush` or `close` commit the rest. The file may be shared by several
+    processes, and one instance by several threads; a forked process has to `reopen` it before use.
+    """
+
+    SCHEMA = """CREATE TABLE IF NOT EXISTS positions (
+        kind INTEGER NOT NULL,
+        swe_id TEXT NOT NULL,
+        jd REAL NOT NULL,
+        method INTEGER NOT NULL,
+        flags INTEGER NOT NULL,
+        lon REAL NOT NULL,
+        lat REAL NOT NULL,
+        alt REAL NOT NULL,
+        version TEXT NOT NULL,
+        value BLOB NOT NULL,
+        PRIMARY KEY (kind, swe_id, jd, method, flags, lon, lat, alt, version)
+    )"""
+    # `method` of plain positions, which have no `swe.nod_aps_ut` method in their key
+    NO_METHOD = -1
+    # `kind` of swisseph body numbers and of fixed star names, both stored as text in `swe_id`
+    BODY = 0
+    STAR = 1
+    COLUMNS = "kind, swe_id, jd, method, flags, lon, lat, alt"
+
+    def __init__(self, path: str, *, version: str | None = None, batch_size: int = 1000):
+        self.path = path
+        self.version = swe.version if version is None else version
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self.__pending = {}
+        self.__lock = threading.Lock()
+        self.__inherited = None
+        self.__db = self.__connect()
+
+    def __connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(DiskPositionCache.SCHEMA)
+        db.commit()
+        return db
+
+    def reopen(self):
+        """Connect anew in a forked process, dropping the writes buffered by the parent, which commits them"""
+        # the connection of the parent must neither be used nor closed here, only kept from garbage collection
+        self.__inherited = self.__db
+        self.__lock = threading.Lock()
+        self.__pending = {}
+        self.__db = self.__connect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        with self.__lock:
+            self.__flush()
+            self.__db.close()
+
+    @staticmethod
+    def __encode_key(key: tuple) -> tuple | None:
+        """Column values of a cache key, with NumPy scalars turned into plain numbers; `None` without observer"""
+        if len(key) == 4:
+            (swe_id, jd, flags, topo) = key
+            method = DiskPositionCache.NO_METHOD
+        else:
+            (swe_id, jd, method, flags, topo) = key
+        if topo is None:
+            return None
+        if isinstance(swe_id, str):
+            ident = (DiskPositionCache.STAR, swe_id)
+        else:
+            ident = (DiskPositionCache.BODY, str(int(swe_id)))
+        return ident + (float(jd), int(method), int(flags)) + tuple(float(value) for value in topo)
+
+    @staticmethod
+    def __decode_key(row: tuple) -> tuple:
+        (kind, swe_id, jd, method, flags, lon, lat, alt) = row
+        if kind == DiskPositionCache.BODY:
+            swe_id = int(swe_id)
+        if method == DiskPositionCache.NO_METHOD:
+            return swe_id, jd, flags, (lon, lat, alt)
+        return swe_id, jd, method, flags, (lon, lat, alt)
+
+    def get(self, key: tuple):
+        columns = DiskPositionCache.__encode_key(key)
+        with self.__lock:
+            value = self.__pending.get(columns)
+            if value is None and columns is not None:
+                row = self.__db.execute("SELECT value FROM positions WHERE kind = ? AND swe_id = ? AND jd = ? "
+                                        "AND method = ? AND flags = ? AND lon = ? AND lat = ? AND alt = ? "
+                                        "AND version = ?", columns + (self.version,)).fetchone()
+                if row is not None:
+                    value = self.__decode(row[0])
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value):
+        columns = DiskPositionCache.__encode_key(key)
+        if columns is None:
+            return
+        with self.__lock:
+            self.__pending[columns] = value
+            if len(self.__pending) >= self.batch_size:
+                self.__flush()
+
+    def flush(self):
+        with self.__lock:
+            self.__flush()
+
+    def __flush(self):
+        if not self.__pending:
+            return
+        with self.__db:
+            self.__db.executemany(f"INSERT OR REPLACE INTO positions ({DiskPositionCache.COLUMNS}, version, value) "
+                                  "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                  [columns + (self.version, np.asarray(value, dtype=np.float64).tobytes())
+                                   for (columns, value) in self.__pending.items()])
+        self.__pending.clear()
+
+    def entries(self, *, limit: int | None = None):
+        """`(key, value)` pairs of this version, newest first"""
+        query = f"SELECT {DiskPositionCache.COLUMNS}, value FROM positions WHERE version = ? ORDER BY rowid DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self.__lock:
+            self.__flush()
+            rows = self.__db.execute(query, (self.version,)).fetchall()
+        for row in rows:
+            yield DiskPositionCache.__decode_key(row[:-1]), self.__decode(row[-1])
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__flush()
+            return self.__db.execute("SELECT COUNT(*) FROM positions WHERE version = ?", (self.version,)).fetchone()[0]
+
+    @staticmethod
+    def __decode(blob: bytes) -> tuple:
+        """Flat 6-tuple, or tuple of 6-tuples for `swe.nod_aps_ut` results"""
+        values = np.frombuffer(blob, dtype=np.float64)
+        if values.size == 6:
+            return tuple(values.tolist())
+        return tuple(tuple(row) for row in values.reshape(-1, 6).tolist())
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'pending': len(self.__pending)}
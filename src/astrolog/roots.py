@@ -0,0 +1,42 @@
+"""Vectorized root finding shared by the event searches and the rise, set and culmination times.
+
+Brackets are Julian days `a`, `b` around a sign change of an event function and are refined all at once.
+"""
+import numpy as np
+
+# refinement stops when an iteration moves the estimate by less than this, days (about 0.01 s)
+TOLERANCE = 1e-7
+ITERATIONS = 60
+
+
+def refine(func, a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray) -> np.ndarray:
+    """Illinois (modified regula falsi) search for zeros of `func` in many brackets at once.
+
+    `func(jds, brackets)` returns the function values at Julian days `jds` for the brackets with indices
+    `brackets`; `fa` and `fb` are its values at the ends of the brackets and must differ in sign. Each
+    iteration evaluates `func` once for the unfinished brackets.
+    """
+    (a, b, fa, fb) = (np.array(x, dtype=np.float64) for x in (a, b, fa, fb))
+    side = np.zeros(a.shape, dtype=np.int8)
+    roots = np.where(fa == 0.0, a, b)
+    active = np.flatnonzero((fa != 0.0) & (fb != 0.0))
+    for _ in range(ITERATIONS):
+        if active.size == 0:
+            break
+        c = b[active] - fb[active] * (b[active] - a[active]) / (fb[active] - fa[active])
+        moving = np.abs(c - roots[active]) >= TOLERANCE
+        roots[active] = c
+        (active, c) = (active[moving], c[moving])
+        if active.size == 0:
+            break
+        fc = func(c, active)
+        same = np.sign(fc) == np.sign(fb[active])
+        (right, left) = (active[same], active[~same])
+        (b[right], fb[right]) = (c[same], fc[same])
+        fa[right[side[right] == 1]] /= 2.0
+        side[right] = 1
+        (a[left], fa[left]) = (c[~same], fc[~same])
+        fb[left[side[left] == -1]] /= 2.0
+        side[left] = -1
+        active = active[fc != 0.0]
+    return roots
@@ -0,0 +1,89 @@
+import numpy as np
+import swisseph as swe
+
+from .celestials import Celestial
+from .primitives import GeoLocation
+from .coords import EclCoord, EquatorCoord, EclSpeed, EquatorSpeed, ECL_DTYPE, EQUATOR_DTYPE
+from .topo import set_topo
+
+
+class SkySnapshot:
+    """Positions of a set of celestials at one instant, computed in a single pass"""
+
+    FRAMES = ("ecl", "equ")
+
+    def __init__(self, jd: float, location: GeoLocation, bodies: [Celestial], *,
+                 frames: tuple = FRAMES, speed: bool = True):
+        for frame in frames:
+            if frame not in SkySnapshot.FRAMES:
+                raise RuntimeError(f"Unknown frame {frame}")
+        self.jd = jd
+        self.location = location
+        self.bodies = list(bodies)
+        self.speed = speed
+        self.index = {body: i for (i, body) in enumerate(self.bodies)}
+        self.ecl = np.zeros(len(self.bodies), dtype=ECL_DTYPE) if "ecl" in frames else None
+        self.equator = np.zeros(len(self.bodies), dtype=EQUATOR_DTYPE) if "equ" in frames else None
+        self.__compute()
+
+    @classmethod
+    def from_arrays(cls, jd: float, location: GeoLocation, bodies: [Celestial], *,
+                    ecl: np.ndarray | None = None, equator: np.ndarray | None = None, speed: bool = True):
+        """Snapshot over positions computed elsewhere, rows of `ecl`/`equator` in the order of `bodies`"""
+        snapshot = cls.__new__(cls)
+        snapshot.jd = jd
+        snapshot.location = location
+        snapshot.bodies = list(bodies)
+        snapshot.speed = speed
+        snapshot.index = {body: i for (i, body) in enumerate(snapshot.bodies)}
+        snapshot.ecl = ecl
+        snapshot.equator = equator
+        return snapshot
+
+    def __compute(self):
+        set_topo(self.location)
+        ecl = None if self.ecl is None else self.ecl.view(np.float64).reshape(-1, 6)
+        equator = None if self.equator is None else self.equator.view(np.float64).reshape(-1, 6)
+        if ecl is not None and equator is not None:
+            ((eps, _, _, _, _, _), _) = swe.calc_ut(self.jd, swe.ECL_NUT, 0)
+            for (i, body) in enumerate(self.bodies):
+                (ecl[i], equator[i]) = body._calc_frames(self.jd, eps, speed=self.speed)
+            return
+        for (i, body) in enumerate(self.bodies):
+            if ecl is not None:
+                ecl[i] = body._calc(self.jd, speed=self.speed, equatorial=False)
+            if equator is not None:
+                equator[i] = body._calc(self.jd, speed=self.speed, equatorial=True)
+
+    def __contains__(self, body: Celestial) -> bool:
+        return body in self.index
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def covers(self, body: Celestial, frame: str, *, speed: bool = False) -> bool:
+        if body not in self.index or (speed and not self.speed):
+            return False
+        return (self.ecl if frame == "ecl" else self.equator) is not None
+
+    def ecl_coord(self, body: Celestial, *, speed: bool = False) -> EclCoord | EclSpeed:
+        if self.ecl is None:
+            raise RuntimeError("ecliptic frame was not computed for this snapshot")
+        row = self.ecl[self.index[body]]
+        if speed:
+            if not self.speed:
+                raise RuntimeError("speeds were not computed for this snapshot")
+            return EclSpeed(float(row['lon']), float(row['lat']), float(row['lon_speed']), float(row['lat_speed']))
+        else:
+            return EclCoord(float(row['lon']), float(row['lat']))
+
+    def equator_coord(self, body: Celestial, *, speed: bool = False) -> EquatorCoord | EquatorSpeed:
+        if self.equator is None:
+            raise RuntimeError("equatorial frame was not computed for this snapshot")
+        row = self.equator[self.index[body]]
+        if speed:
+            if not self.speed:
+                raise RuntimeError("speeds were not computed for this snapshot")
+            return EquatorSpeed(float(row['ra']), float(row['decl']), float(row['ra_speed']), float(row['decl_speed']))
+        else:
+            return EquatorCoord(float(row['ra']), float(row['decl']))
@@ -0,0 +1,51 @@
+"""Conversion of calendar times to Julian days (UT).
+
+Naive datetimes are taken as UT, aware ones are converted to UTC first; UTC is used as UT, which is
+within 0.9 s of UT1. Seconds and microseconds are kept. Dates are proleptic Gregorian like `datetime`.
+"""
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Julian day of 0001-01-01 00:00 minus one, so that `toordinal() + JD_ORDINAL` is the Julian day of a midnight
+JD_ORDINAL = 1721424.5
+JD_UNIX_EPOCH = 2440587.5
+MICROSECONDS_PER_DAY = 86400e6
+
+
+def julday(time: datetime) -> float:
+    """Julian day (UT) of a naive (UT) or timezone-aware datetime"""
+    if time.tzinfo is not None and time.utcoffset() is not None:
+        time = time.astimezone(timezone.utc)
+    seconds = time.hour * 3600 + time.minute * 60 + time.second + time.microsecond / 1e6
+    return time.toordinal() + JD_ORDINAL + seconds / 86400.0
+
+
+def juldays(times) -> np.ndarray:
+    """Julian days (UT) for an array of times in one vectorized step.
+
+    Accepts NumPy `datetime64` arrays (taken as UTC), pandas timestamps, `DatetimeIndex` and datetime
+    `Series` (converted to UTC when tz-aware), sequences of naive or aware datetimes, and numeric arrays,
+    which are returned as Julian days unchanged.
+    """
+    if isinstance(times, datetime):
+        return np.float64(julday(times))
+    if hasattr(times, "dt"):
+        if times.dt.tz is not None:
+            times = times.dt.tz_convert("UTC").dt.tz_localize(None)
+        times = times.to_numpy()
+    elif getattr(times, "tz", None) is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    array = np.asarray(times)
+    if array.dtype.kind in "iuf":
+        return array.astype(np.float64)
+    if array.dtype == object:
+        array = np.array([_naive_utc(time) for time in array.ravel().tolist()], dtype="datetime64[us]").reshape(array.shape)
+    microseconds = array.astype("datetime64[us]").astype(np.int64)
+    return JD_UNIX_EPOCH + microseconds / MICROSECONDS_PER_DAY
+
+
+def _naive_utc(time: datetime) -> datetime:
+    if time.tzinfo is not None and time.utcoffset() is not None:
+        return time.astimezone(timezone.utc).replace(tzinfo=None)
+    return time
@@ -0,0 +1,77 @@
+import threading
+
+import swisseph as swe
+
+from .primitives import GeoLocation
+
+# swisseph keeps the topocentric observer per thread, so is the tracking of it
+_state = threading.local()
+
+
+def topo_key(location: GeoLocation) -> tuple:
+    """Observer `(longitude, latitude, altitude)` as passed to `swe.set_topo`"""
+    return location.longitude.degrees, location.latitude.degrees, 0.0
+
+
+def set_topo(location: GeoLocation):
+    """Set the swisseph topocentric observer unless it is already the current one.
+
+    `swe.set_topo` invalidates swisseph internal caches, so repeated calls for the same place are skipped.
+    Code calling `swe.set_topo` directly bypasses this tracking and has to call `reset_topo` afterwards.
+    """
+    topo = topo_key(location)
+    if topo == current_topo():
+        return
+    swe.set_topo(*topo)
+    _state.current = topo
+
+
+def reset_topo():
+    """Forget the tracked observer of this thread so the next `set_topo` always reaches swisseph"""
+    _state.current = None
+
+
+def current_topo() -> tuple | None:
+    """Observer `(longitude, latitude, altitude)` last passed to swisseph on this thread, `None` if never set"""
+    return getattr(_state, 'current', None)
+
+
+def group_by_location(items, location) -> [(GeoLocation, list)]:
+    """Group `items` by the observer returned by `location(item)`, keeping first-seen order of places"""
+    groups = {}
+    for item in items:
+        loc = location(item)
+        key = topo_key(loc)
+        if key not in groups:
+            groups[key] = (loc, [])
+        groups[key][1].append(item)
+    return list(groups.values())
+
+
+class Observer:
+    """Topocentric context: `with Observer(location):` makes `location` the swisseph observer.
+
+    The previous observer of the thread is restored on exit, so contexts can be nested, also on several
+    threads at once.
+    """
+
+    def __init__(self, location: GeoLocation):
+        self.location = location
+        self.__previous = threading.local()
+
+    def __stack(self) -> list:
+        if not hasattr(self.__previous, 'stack'):
+            self.__previous.stack = []
+        return self.__previous.stack
+
+    def __enter__(self):
+        self.__stack().append(current_topo())
+        set_topo(self.location)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        previous = self.__stack().pop()
+        if previous is not None and previous != current_topo():
+            swe.set_topo(*previous)
+            _state.current = previous
+        return False
@@ -0,0 +1,103 @@
+"""Vectorized coordinate transforms between ecliptic, equatorial and horizontal frames.
+
+All angles are in degrees and speeds in degrees per day; arguments broadcast like NumPy arrays. Obliquity
+and local sidereal time are supplied per instant, see `obliquity` and `sidereal_time`. Azimuth follows the
+swisseph convention: measured from the south, clockwise through the west.
+"""
+import numpy as np
+import swisseph as swe
+
+# rate of the sidereal time, degrees per day
+SIDEREAL_RATE = 360.98564736629
+
+
+def obliquity(jds) -> np.ndarray:
+    """True obliquity of the ecliptic for Julian days (UT)"""
+    jds = np.asarray(jds, dtype=np.float64)
+    eps = np.fromiter((swe.calc_ut(jd, swe.ECL_NUT, 0)[0][0] for jd in jds.ravel().tolist()), np.float64, jds.size)
+    return eps.reshape(jds.shape)
+
+
+def sidereal_time(jds, longitude) -> np.ndarray:
+    """Local apparent sidereal time for Julian days (UT) at geographic `longitude`"""
+    jds = np.asarray(jds, dtype=np.float64)
+    gast = np.fromiter((swe.sidtime(jd) for jd in jds.ravel().tolist()), np.float64, jds.size)
+    return (gast.reshape(jds.shape) * 15.0 + longitude) % 360.0
+
+
+def _cartesian(lon, lat, lon_speed, lat_speed):
+    (lon, lat) = (np.radians(lon), np.radians(lat))
+    (cl, sl, cb, sb) = (np.cos(lon), np.sin(lon), np.cos(lat), np.sin(lat))
+    x = np.stack(np.broadcast_arrays(cb * cl, cb * sl, sb))
+    if lon_speed is None:
+        return x, None
+    (dl, db) = (np.radians(lon_speed), np.radians(lat_speed))
+    dx = np.stack(np.broadcast_arrays(-sb * cl * db - cb * sl * dl, -sb * sl * db + cb * cl * dl, cb * db))
+    return x, dx
+
+
+def _spherical(x, dx):
+    lon = np.degrees(np.arctan2(x[1], x[0])) % 360.0
+    lat = np.degrees(np.arcsin(np.clip(x[2], -1.0, 1.0)))
+    if dx is None:
+        return lon, lat
+    rho2 = x[0] * x[0] + x[1] * x[1]
+    lon_speed = np.degrees((x[0] * dx[1] - x[1] * dx[0]) / rho2)
+    lat_speed = np.degrees(dx[2] / np.sqrt(rho2))
+    return lon, lat, lon_speed, lat_speed
+
+
+def _rotate_x(x, angle):
+    """Rotate the frame about the x axis by `angle` degrees"""
+    (c, s) = (np.cos(np.radians(angle)), np.sin(np.radians(angle)))
+    return np.stack([x[0], c * x[1] + s * x[2], -s * x[1] + c * x[2]])
+
+
+def _rotate_y(x, angle):
+    """Rotate the frame about the y axis by `angle` degrees"""
+    (c, s) = (np.cos(np.radians(angle)), np.sin(np.radians(angle)))
+    return np.stack([c * x[0] - s * x[2], x[1], s * x[0] + c * x[2]])
+
+
+def ecl_to_equator(lon, lat, eps, lon_speed=None, lat_speed=None) -> tuple:
+    """Ecliptic to equatorial: `(ra, decl)` or `(ra, decl, ra_speed, decl_speed)` if speeds are given"""
+    (x, dx) = _cartesian(lon, lat, lon_speed, lat_speed)
+    return _spherical(_rotate_x(x, -np.asarray(eps)), None if dx is None else _rotate_x(dx, -np.asarray(eps)))
+
+
+def equator_to_ecl(ra, decl, eps, ra_speed=None, decl_speed=None) -> tuple:
+    """Equatorial to ecliptic: `(lon, lat)` or `(lon, lat, lon_speed, lat_speed)` if speeds are given"""
+    (x, dx) = _cartesian(ra, decl, ra_speed, decl_speed)
+    return _spherical(_rotate_x(x, np.asarray(eps)), None if dx is None else _rotate_x(dx, np.asarray(eps)))
+
+
+def equator_to_hor(ra, decl, lst, latitude, ra_speed=None, decl_speed=None) -> tuple:
+    """Equatorial (of date) to horizontal: `(azimuth, altitude)` or with `(azimuth_speed, altitude_speed)`"""
+    hour_angle = np.asarray(lst) - np.asarray(ra)
+    hour_angle_speed = None if ra_speed is None else SIDEREAL_RATE - np.asarray(ra_speed)
+    (x, dx) = _cartesian(hour_angle, decl, hour_angle_speed, decl_speed)
+    colat = 90.0 - np.asarray(latitude)
+    return _spherical(_rotate_y(x, colat), None if dx is None else _rotate_y(dx, colat))
+
+
+def hor_to_equator(azimuth, altitude, lst, latitude, azimuth_speed=None, altitude_speed=None) -> tuple:
+    """Horizontal to equatorial (of date): `(ra, decl)` or with `(ra_speed, decl_speed)`"""
+    (x, dx) = _cartesian(azimuth, altitude, azimuth_speed, altitude_speed)
+    colat = 90.0 - np.asarray(latitude)
+    result = _spherical(_rotate_y(x, -colat), None if dx is None else _rotate_y(dx, -colat))
+    ra = (np.asarray(lst) - result[0]) % 360.0
+    if dx is None:
+        return ra, result[1]
+    return ra, result[1], SIDEREAL_RATE - result[2], result[3]
+
+
+def ecl_to_hor(lon, lat, eps, lst, latitude, lon_speed=None, lat_speed=None) -> tuple:
+    """Ecliptic (of date) to horizontal, see `equator_to_hor`"""
+    equator = ecl_to_equator(lon, lat, eps, lon_speed, lat_speed)
+    return equator_to_hor(*equator[:2], lst, latitude, *equator[2:])
+
+
+def hor_to_ecl(azimuth, altitude, eps, lst, latitude, azimuth_speed=None, altitude_speed=None) -> tuple:
+    """Horizontal to ecliptic (of date), see `hor_to_equator`"""
+    equator = hor_to_equator(azimuth, altitude, lst, latitude, azimuth_speed, altitude_speed)
+    return equator_to_ecl(*equator[:2], eps, *equator[2:])
@@ -0,0 +1,62 @@
+import asyncio
+
+from astrolog import aio
+from astrolog.celestials import Planet
+from astrolog.primitives import GeoLocation
+
+PRAGUE = GeoLocation(14.42, 50.09)
+SANTIAGO = GeoLocation(-70.67, -33.45)
+JDS = [2451545.0, 2451545.5]
+
+
+def test_aio_and_main_thread_observers_do_not_mix():
+    (prague, santiago) = (Planet.Moon.ecl_series(JDS, place)['lon'] for place in (PRAGUE, SANTIAGO))
+
+    async def mixed():
+        ephemeris = aio.AsyncEphemeris()
+        try:
+            results = [(await ephemeris.ecl_series(Planet.Moon, JDS, PRAGUE))['lon']]
+            # the main thread moves its observer, the aio thread has to set its own
+            results.append(Planet.Moon.ecl_series(JDS, SANTIAGO)['lon'])
+            results.append((await ephemeris.ecl_series(Planet.Moon, JDS, SANTIAGO))['lon'])
+            results.append((await ephemeris.ecl_series(Planet.Moon, JDS, PRAGUE))['lon'])
+            results.append(Planet.Moon.ecl_series(JDS, PRAGUE)['lon'])
+            return results
+        finally:
+            ephemeris.shutdown()
+
+    (first, main_santiago, aio_santiago, aio_prague, main_prague) = asyncio.run(mixed())
+    assert list(first) == list(prague)
+    assert list(main_santiago) == list(santiago)
+    assert list(aio_santiago) == list(santiago)
+    assert list(aio_prague) == list(prague)
+    assert list(main_prague) == list(prague)
+    assert abs(prague[0] - santiago[0]) > 0.1
+
+
+def test_aio_on_a_place_first_set_on_the_main_thread():
+    Planet.Sun.ecl_series(JDS, PRAGUE)
+    expected = Planet.Sun.ecl_series(JDS, PRAGUE)['lon']
+
+    async def on_aio():
+        ephemeris = aio.AsyncEphemeris()
+        try:
+            return (await ephemeris.ecl_series(Planet.Sun, JDS, PRAGUE))['lon']
+        finally:
+            ephemeris.shutdown()
+
+    assert list(asyncio.run(on_aio())) == list(expected)
+
+
+def test_default_instance_serves_several_event_loops():
+    async def contended():
+        return await asyncio.gather(*(aio.ecl_series(Planet.Mars, JDS, PRAGUE) for _ in range(20)))
+
+    (ephemeris, aio._default) = (aio._default, aio.AsyncEphemeris(concurrency=2))
+    try:
+        for _ in range(2):
+            results = asyncio.run(contended())
+            assert all(list(result['lon']) == list(results[0]['lon']) for result in results)
+    finally:
+        aio._default.shutdown()
+        aio._default = ephemeris
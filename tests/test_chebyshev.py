@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from astrolog.celestials import Planet
+from astrolog.chebyshev import ChebyshevCache
+from astrolog.primitives import GeoLocation
+from astrolog.topo import reset_topo, set_topo
+
+JDS = 2451545.0 + np.random.default_rng(1).uniform(0.0, 60.0, 200)
+
+
+@pytest.fixture(autouse=True)
+def prague():
+    set_topo(GeoLocation(14.42, 50.09))
+    yield
+    reset_topo()
+
+
+def errors(cache: ChebyshevCache, body: Planet, equatorial: bool) -> np.ndarray:
+    fitted = np.array([cache.lookup(body, jd, equatorial=equatorial) for jd in JDS.tolist()])
+    exact = np.array([body._swe_calc_ut(jd, speed=True, equatorial=equatorial) for jd in JDS.tolist()])
+    error = np.abs(fitted - exact)
+    error[:, 0] = np.minimum(error[:, 0], 360.0 - error[:, 0])
+    return error
+
+
+@pytest.mark.parametrize("body", [Planet.Sun, Planet.Moon, Planet.Mars, Planet.Pluto], ids=lambda body: body.name)
+@pytest.mark.parametrize("equatorial", [False, True], ids=["ecl", "equ"])
+def test_fitted_positions_stay_within_accuracy(body, equatorial):
+    error = errors(ChebyshevCache(), body, equatorial)
+    assert error[:, :2].max() <= 1e-6
+    assert error[:, 3:5].max() <= 5e-3
+
+
+def test_evicted_segments_are_fitted_again():
+    cache = ChebyshevCache(maxsize=2)
+    assert errors(cache, Planet.Mars, False)[:, :2].max() <= 1e-6
+    assert errors(cache, Planet.Mars, False)[:, :2].max() <= 1e-6
+
+
+def test_unreachable_accuracy_falls_back_to_swisseph():
+    cache = ChebyshevCache(accuracy=1e-14, segment_days=64.0)
+    assert cache.lookup(Planet.Moon, JDS[0]) is None
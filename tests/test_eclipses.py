@@ -0,0 +1,28 @@
+import numpy as np
+import swisseph as swe
+
+from astrolog.eclipses import ECLIPSE_KINDS, find_eclipses
+
+START = 2451545.0
+END = START + 20 * 365.25
+
+
+def sequential_scan(search) -> list:
+    (found, jd) = ([], START)
+    while True:
+        (flags, tret) = search(jd, swe.FLG_SWIEPH)
+        if tret[0] >= END:
+            return found
+        found.append((tret[0], flags))
+        jd = tret[0] + 1.0
+
+
+def test_catalog_matches_a_sequential_swisseph_search():
+    eclipses = find_eclipses(START, END)
+    for (kind, search) in (("solar", swe.sol_eclipse_when_glob), ("lunar", swe.lun_eclipse_when)):
+        rows = eclipses[eclipses['kind'] == ECLIPSE_KINDS.index(kind)]
+        expected = sequential_scan(search)
+        assert rows.size == len(expected)
+        assert np.allclose(rows['jd'], [jd for (jd, _) in expected], rtol=0.0, atol=1e-6)
+        assert list(rows['type']) == [flags for (_, flags) in expected]
+    assert np.all(np.diff(eclipses['jd']) > 0)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astrolog.celestials import AscNode, Planet, PeriApsis
+from astrolog.ephemfile import EphemerisFile, write_ephemeris
+from astrolog.primitives import GeoLocation
+from astrolog.topo import reset_topo, set_topo
+
+PRAGUE = GeoLocation(14.42, 50.09)
+START = 2451545.0
+ARCSEC = 1.0 / 3600.0
+
+
+def max_error(path: str, bodies: list, days: float) -> float:
+    table = EphemerisFile(path)
+    jds = START + np.random.default_rng(2).uniform(0.0, days, 200)
+    set_topo(PRAGUE)
+    try:
+        worst = 0.0
+        for body in bodies:
+            for equatorial in (False, True):
+                exact = np.array([body._swe_calc(jd, speed=True, equatorial=equatorial) for jd in jds.tolist()])
+                error = np.abs(table.series(body, jds, equatorial=equatorial) - exact)[:, :2]
+                error[:, 0] = np.minimum(error[:, 0], 360.0 - error[:, 0])
+                worst = max(worst, error.max())
+        return worst
+    finally:
+        reset_topo()
+
+
+def test_daily_samples_hold_planets_to_arc_seconds(tmp_path):
+    path = str(tmp_path / "planets.eph")
+    bodies = [Planet.Sun, Planet.Mercury, Planet.Mars, Planet.Pluto, AscNode("Asc Mars", swe.MARS),
+              PeriApsis("Peri Mars", swe.MARS)]
+    assert write_ephemeris(path, PRAGUE, START, START + 60.0, bodies=bodies) == []
+    assert max_error(path, bodies, 60.0) < 10 * ARCSEC
+
+
+def test_hourly_samples_hold_the_moon_and_its_nodes(tmp_path):
+    path = str(tmp_path / "moon.eph")
+    bodies = [Planet.Moon, AscNode("Asc Moon", swe.MOON), PeriApsis("Peri Moon", swe.MOON)]
+    assert write_ephemeris(path, PRAGUE, START, START + 10.0, step=1.0 / 24.0, bodies=bodies) == []
+    assert max_error(path, bodies, 10.0) < 0.5 * ARCSEC
+
+
+def test_bodies_without_ephemeris_are_reported(tmp_path):
+    eris = Planet("Eris")
+    try:
+        swe.calc_ut(START, eris.swe_id(), swe.FLG_SWIEPH)
+        pytest.skip("the Eris ephemeris file is installed")
+    except swe.Error:
+        pass
+    path = tmp_path / "table.eph"
+    assert write_ephemeris(str(path), PRAGUE, START, START + 2.0, bodies=[Planet.Sun, eris]) == [eris]
+    assert Planet.Sun in EphemerisFile(str(path))
+    assert [file.name for file in tmp_path.iterdir()] == ["table.eph"]
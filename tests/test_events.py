@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astrolog.celestials import Planet
+from astrolog.events import find_ingresses, find_lunations, find_stations
+from astrolog.primitives import GeoLocation
+
+START = 2451545.0
+END = START + 10 * 365.25
+PRAGUE = GeoLocation(14.42, 50.09)
+
+
+def geocentric_longitude(body, jds) -> np.ndarray:
+    return np.array([swe.calc_ut(jd, body.swe_id(), swe.FLG_SWIEPH)[0][0] for jd in jds])
+
+
+def geocentric_speed(body, jds) -> np.ndarray:
+    return np.array([swe.calc_ut(jd, body.swe_id(), swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3] for jd in jds])
+
+
+@pytest.mark.parametrize("body", [Planet.Mercury, Planet.Venus, Planet.Mars, Planet.Jupiter, Planet.Pluto],
+                         ids=lambda body: body.name)
+def test_stations_match_a_daily_scan_of_the_speed(body):
+    stations = find_stations(body, START, END)
+    speed = geocentric_speed(body, np.arange(START, END, 1.0))
+    assert stations.size == np.count_nonzero(np.sign(speed[:-1]) != np.sign(speed[1:]))
+    assert np.all(np.diff(stations['jd']) > 0)
+    # turning retrograde and turning direct alternate
+    assert np.all(stations['direction'][1:] == -stations['direction'][:-1])
+    (before, after) = (geocentric_speed(body, stations['jd'] - 0.01), geocentric_speed(body, stations['jd'] + 0.01))
+    assert np.all(np.sign(after) == stations['direction'])
+    assert np.all(np.sign(before) == -stations['direction'])
+
+
+@pytest.mark.parametrize("body", [Planet.Sun, Planet.Moon, Planet.Mercury, Planet.Mars], ids=lambda body: body.name)
+def test_ingresses_match_a_scan_of_the_sign(body):
+    (start, end) = (START, START + 2 * 365.25)
+    ingresses = find_ingresses(body, start, end, PRAGUE)
+    jds = np.arange(start, end, 1.0 / 24.0)
+    signs = (body.ecl_series(jds, PRAGUE)['lon'] // 30.0).astype(int)
+    assert ingresses.size == np.count_nonzero(signs[1:] != signs[:-1])
+    lon = body.ecl_series(ingresses['jd'], PRAGUE)['lon']
+    assert np.allclose((lon + 15.0) % 30.0, 15.0, atol=1e-5)
+    assert np.all(ingresses['to_sign'] == (ingresses['from_sign'] + ingresses['direction']) % 12)
+    assert np.all(ingresses['from_sign'][1:] == ingresses['to_sign'][:-1])
+
+
+def test_lunations_are_geocentric_and_cycle_through_the_phases():
+    lunations = find_lunations(START, START + 365.25)
+    assert lunations.size in (49, 50)
+    assert np.all(np.diff(lunations['phase']) % 360.0 == 90.0)
+    sun = geocentric_longitude(Planet.Sun, lunations['jd'])
+    moon = geocentric_longitude(Planet.Moon, lunations['jd'])
+    assert np.allclose((moon - sun - lunations['phase'] + 180.0) % 360.0, 180.0, atol=1e-5)
+    assert np.allclose(lunations['moon_lon'], moon) and np.allclose(lunations['sun_lon'], sun)
+    # the new moon of 2000 January 6, 18:14 UT
+    assert abs(lunations['jd'][0] - 2451550.2595) < 1e-3
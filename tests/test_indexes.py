@@ -0,0 +1,57 @@
+import numpy as np
+import swisseph as swe
+
+from astrolog.celestials import Planet
+from astrolog.events import find_aspect_times
+from astrolog.indexes import AspectIndex, RetrogradeIndex, SignIndex
+from astrolog.primitives import GeoLocation
+
+PRAGUE = GeoLocation(14.42, 50.09)
+START = 2451545.0
+
+
+def test_sign_index_matches_the_longitude(tmp_path):
+    bodies = [Planet.Sun, Planet.Moon, Planet.Mars]
+    index = SignIndex.build(START, START + 365.25, PRAGUE, bodies=bodies)
+    index.save(str(tmp_path / "signs.npz"))
+    loaded = SignIndex.load(str(tmp_path / "signs.npz"))
+    jds = START + np.random.default_rng(3).uniform(0.0, 365.25, 500)
+    for body in bodies:
+        signs = (body.ecl_series(jds, PRAGUE)['lon'] // 30.0).astype(int)
+        assert np.array_equal(loaded.sign_index(body, jds), signs)
+    assert list(loaded.sign_index(Planet.Sun, [START - 1.0, START + 366.0])) == [-1, -1]
+
+
+def test_retrograde_index_matches_the_speed(tmp_path):
+    bodies = [Planet.Mercury, Planet.Mars, Planet.Saturn]
+    index = RetrogradeIndex.build(START, START + 3 * 365.25, bodies=bodies)
+    index.save(str(tmp_path / "retrograde.npz"))
+    loaded = RetrogradeIndex.load(str(tmp_path / "retrograde.npz"))
+    assert loaded.topo is None
+    jds = START + np.random.default_rng(4).uniform(0.0, 3 * 365.25, 500)
+    for body in bodies:
+        speed = np.array([swe.calc_ut(jd, body.swe_id(), swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3] for jd in jds.tolist()])
+        assert np.array_equal(loaded.is_retrograde(body, jds), speed < 0)
+        periods = loaded.between(body, START, START + 3 * 365.25)
+        assert np.all(periods['start'] < periods['end'])
+        assert np.array_equal(loaded.overlaps(body, periods['start'], periods['end']), np.ones(periods.size, dtype=bool))
+
+
+def test_aspect_index_matches_find_aspect_times(tmp_path):
+    bodies = [Planet.Sun, Planet.Moon, Planet.Venus, Planet.Mars]
+    (end, orb) = (START + 90.0, 0.5)
+    index = AspectIndex.build(START, end, bodies=bodies, harmonics=(1, 2, 4), orb=orb)
+    index.save(str(tmp_path / "aspects.npz"))
+    loaded = AspectIndex.load(str(tmp_path / "aspects.npz"))
+    assert loaded.topo is None
+    events = loaded.between(START, end, exact=True)
+    expected = find_aspect_times(bodies, bodies, START, end, harmonics=(1, 2, 4))
+    assert np.allclose(np.sort(events['jd']), expected['jd'], rtol=0.0, atol=1e-6)
+    # the separation is off the exact angle by the orb where a stay in orb begins or ends inside the span
+    for row in events:
+        angle = 360.0 / row['harmonic'] if row['harmonic'] > 1 else 0.0
+        for jd in (row['enter'], row['leave']):
+            if START < jd < end:
+                (lon1, lon2) = (swe.calc_ut(jd, bodies[k].swe_id(), swe.FLG_SWIEPH)[0][0] for k in (row['body1'], row['body2']))
+                separation = abs(lon1 - lon2)
+                assert abs(abs(min(separation, 360.0 - separation) - angle) - orb) < 1e-5
@@ -0,0 +1,37 @@
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
+import pytest
+import swisseph as swe
+
+from astrolog.celestials import ApoApsis, ApsisNode, AscNode, Celestial, DscNode, PeriApsis, SecondFocus
+from astrolog.poscache import PositionCache
+from astrolog.primitives import GeoLocation
+from astrolog.topo import set_topo
+
+PRAGUE = GeoLocation(14.42, 50.09)
+JDS = 2451545.0 + np.arange(0.0, 3.0, 0.25)
+FLAGS = swe.FLG_SWIEPH | swe.FLG_TOPOCTR | swe.FLG_SPEED
+
+
+def expected(body: int, method: int) -> np.ndarray:
+    set_topo(PRAGUE)
+    return np.array([swe.nod_aps_ut(jd, body, method, FLAGS) for jd in JDS.tolist()])
+
+
+@pytest.mark.parametrize("cache", [None, PositionCache()], ids=["bundles", "cache"])
+def test_points_share_one_nod_aps_result(cache):
+    Celestial.cache = cache
+    try:
+        points = [AscNode("Asc Mars", swe.MARS), DscNode("Dsc Mars", swe.MARS), PeriApsis("Peri Mars", swe.MARS),
+                  ApoApsis("Apo Mars", swe.MARS)]
+        series = [point.ecl_series(JDS, PRAGUE, speed=True) for point in points]
+        bundle = ApsisNode.all_points(swe.MARS, JDS, PRAGUE, speed=True)
+        focus = SecondFocus("BS Mars", swe.MARS).ecl_series(JDS, PRAGUE, speed=True)
+    finally:
+        Celestial.cache = None
+    osculating = expected(swe.MARS, swe.NODBIT_OSCU)
+    for (i, values) in enumerate(series):
+        assert np.array_equal(structured_to_unstructured(values), osculating[:, i])
+        assert np.array_equal(structured_to_unstructured(bundle[:, i]), osculating[:, i])
+    second = expected(swe.MARS, swe.NODBIT_OSCU | swe.NODBIT_FOPOINT)
+    assert np.array_equal(structured_to_unstructured(focus), second[:, 3])
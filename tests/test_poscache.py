@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import threading
+
+import numpy as np
+
+from astrolog import aio
+from astrolog.celestials import Celestial, Planet
+from astrolog.chebyshev import ChebyshevCache
+from astrolog.poscache import DiskPositionCache, PositionCache
+from astrolog.primitives import GeoLocation
+
+POSITION = (1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+BUNDLE = tuple(tuple(float(6 * row + i) for i in range(6)) for row in range(4))
+TOPO = (14.42, 50.09, 0.0)
+PRAGUE = GeoLocation(14.42, 50.09)
+
+
+def test_numpy_keys_round_trip_through_disk(tmp_path):
+    path = str(tmp_path / "positions.db")
+    with DiskPositionCache(path) as disk:
+        disk.put((np.int64(1), np.float64(2451545.0), np.int32(33026), TOPO), POSITION)
+        disk.put((1, np.float64(2451545.5), 2, 33026, TOPO), BUNDLE)
+    with DiskPositionCache(path) as disk:
+        cache = PositionCache(backing=disk)
+        assert cache.preload() == 2
+        assert (1, 2451545.0, 33026, TOPO) in cache
+        assert (1, 2451545.5, 2, 33026, TOPO) in cache
+        assert disk.get((1, 2451545.0, 33026, TOPO)) == POSITION
+        assert disk.get((1, np.float64(2451545.5), 2, 33026, TOPO)) == BUNDLE
+        assert disk.get((1, 2451545.0, 33026, (0.0, 0.0, 0.0))) is None
+
+
+def test_star_names_are_kept_apart_from_body_numbers(tmp_path):
+    path = str(tmp_path / "positions.db")
+    with DiskPositionCache(path) as disk:
+        disk.put(("Sirius", 2451545.0, 33026, TOPO), POSITION)
+        disk.put(("1", 2451545.0, 33026, TOPO), POSITION)
+    with DiskPositionCache(path) as disk:
+        assert disk.get(("Sirius", 2451545.0, 33026, TOPO)) == POSITION
+        assert disk.get(("1", 2451545.0, 33026, TOPO)) == POSITION
+        assert disk.get((1, 2451545.0, 33026, TOPO)) is None
+        cache = PositionCache(backing=disk)
+        assert cache.preload() == 2
+        assert ("1", 2451545.0, 33026, TOPO) in cache
+        assert (1, 2451545.0, 33026, TOPO) not in cache
+
+
+def test_disk_cache_serves_the_aio_thread(tmp_path):
+    jds = 2451545.0 + np.arange(4)
+    expected = Planet.Mars.ecl_series(jds, PRAGUE)
+    with DiskPositionCache(str(tmp_path / "positions.db")) as disk:
+        Celestial.cache = PositionCache(backing=disk)
+        ephemeris = aio.AsyncEphemeris()
+        try:
+            result = asyncio.run(ephemeris.ecl_series(Planet.Mars, jds, PRAGUE))
+        finally:
+            ephemeris.shutdown()
+            Celestial.cache = None
+        assert len(disk) == 4
+    assert list(result['lon']) == list(expected['lon'])
+
+
+def test_lookups_and_evictions_from_several_threads():
+    cache = PositionCache(maxsize=8)
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(20000):
+                key = (1, float((i + offset) % 12), 33026, TOPO)
+                if cache.get(key) is None:
+                    cache.put(key, POSITION)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+    interval = sys.getswitchinterval()
+    # switch threads as often as possible, so that evictions land between a lookup and its update
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    assert len(cache) == 8
+    assert cache.hits + cache.misses == 80000
+
+
+def test_chebyshev_positions_are_not_cached():
+    jd = 2451545.3
+    exact = Planet.Mars.ecl_series([jd], PRAGUE)
+    Celestial.cache = PositionCache()
+    Planet.chebyshev = ChebyshevCache(accuracy=1e-3)
+    try:
+        approximate = Planet.Mars.ecl_series([jd], PRAGUE)
+        assert len(Celestial.cache) == 0
+        Planet.chebyshev = None
+        assert list(Planet.Mars.ecl_series([jd], PRAGUE)) == list(exact)
+    finally:
+        Planet.chebyshev = None
+        Celestial.cache = None
+    assert abs(approximate['lon'][0] - exact['lon'][0]) < 1e-3
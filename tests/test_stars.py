@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astrolog.stars import StarCatalog
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    try:
+        path = StarCatalog.find_star_file()
+    except RuntimeError:
+        pytest.skip("sefstars.txt is not in the ephemeris path")
+    # swisseph has to read the same file the catalog was parsed from
+    swe.set_ephe_path(path.rsplit("/", 1)[0])
+    yield StarCatalog.load(path)
+    swe.set_ephe_path(None)
+
+
+@pytest.mark.parametrize("jd", [2415020.5, 2451545.0, 2460000.5])
+def test_positions_agree_with_fixstar_ut(catalog, jd):
+    deviation = catalog.deviation(jd)
+    (ecl, _) = catalog.positions(jd)
+    ((sun_lon, _, _, _, _, _), _) = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)
+    (lon, lat) = (np.radians(ecl['lon']), np.radians(ecl['lat']))
+    elongation = np.degrees(np.arccos(np.cos(lat) * np.cos(lon - np.radians(sun_lon))))
+    # light deflection near the Sun is not applied, and swisseph flips stars with a negative parallax
+    compared = (elongation > 10.0) & (catalog.data['parallax'] >= 0.0)
+    assert not np.isnan(deviation[compared]).any()
+    assert deviation[compared].max() < 0.2
+
+
+def test_rows_resolve_to_their_own_star(catalog):
+    for index in (0, len(catalog) // 2, len(catalog) - 1):
+        star = catalog[index]
+        (_, name, _) = swe.fixstar_ut(star.swe_id(), 2451545.0, swe.FLG_SWIEPH)
+        assert name == f"{catalog.names[index]},{catalog.nomenclatures[index]}"
@@ -0,0 +1,23 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from astrolog.celestials import Planet
+from astrolog.primitives import GeoLocation
+
+PLACES = [GeoLocation(14.42, 50.09), GeoLocation(-70.67, -33.45), GeoLocation(-0.19, 5.6), GeoLocation(25.78, 71.17)]
+DAYS = [datetime(2021, 1, 1) + timedelta(days=7 * week) for week in range(53)]
+
+
+@pytest.mark.parametrize("body", [Planet.Sun, Planet.Moon, Planet.Mars, Planet.Mercury], ids=lambda body: body.name)
+def test_transits_agree_with_swisseph_per_event(body):
+    for place in PLACES:
+        for day in DAYS:
+            transits = body.transits(day, place)
+            expected = {'rise': body.rises(day, place), 'set': body.sets(day, place),
+                        'mc': body.mc_trans(day, place), 'ic': body.ic_trans(day, place)}
+            for (kind, offset) in expected.items():
+                if offset is None:
+                    assert transits[kind] is None, (kind, day, place)
+                else:
+                    assert abs(transits[kind] - offset) <= timedelta(seconds=1), (kind, day, place)